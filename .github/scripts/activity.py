@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Activity engine for the README graphs
+Builds one daily count series (from the contributions calendar, or from the
+events API as a fallback) and slices, buckets and renders it per graph, so a
+year-long window or several graphs per README cost one fetch
+"""
+
+import os
+import datetime
+
+from graphql_backend import graphql
+
+ACTIVITY_DAYS = int(os.environ.get("README_ACTIVITY_DAYS", "30"))
+# day, week or month
+ACTIVITY_RESOLUTION = os.environ.get("README_ACTIVITY_RESOLUTION", "day")
+# calendar (contribution calendar via GraphQL) or events (the ~90 days the
+# API keeps, plus whatever earlier runs recorded in the history store)
+ACTIVITY_SOURCE = os.environ.get("README_ACTIVITY_SOURCE", "calendar")
+
+GRAPH_HEIGHT = 7
+
+# contributionsCollection accepts at most one year per query
+CALENDAR_CHUNK_DAYS = 365
+
+CALENDAR_QUERY = """
+query($login: String!, $from: DateTime!, $to: DateTime!) {
+  user(login: $login) {
+    contributionsCollection(from: $from, to: $to) {
+      contributionCalendar {
+        weeks { contributionDays { date contributionCount } }
+      }
+    }
+  }
+}
+"""
+
+
+class ActivitySeries:
+    """Daily counts for every day from start to end, inclusive"""
+
+    def __init__(self, start, counts):
+        self.start = start
+        self.counts = counts
+
+    @classmethod
+    def from_days(cls, start, end, day_counts):
+        counts = [0] * ((end - start).days + 1)
+        for day, count in day_counts.items():
+            index = (day - start).days
+            if 0 <= index < len(counts):
+                counts[index] += count
+        return cls(start, counts)
+
+    @property
+    def end(self):
+        return self.start + datetime.timedelta(days=len(self.counts) - 1)
+
+    def day(self, index):
+        return self.start + datetime.timedelta(days=index)
+
+    def window(self, days):
+        """The last days + 1 days of the series, ending on its last day"""
+        first = max(len(self.counts) - days - 1, 0)
+        return ActivitySeries(self.day(first), self.counts[first:])
+
+    def bucket(self, resolution="day"):
+        """(labels, values): one label date and one total per day, week or month"""
+        if resolution == "day":
+            return [self.day(i) for i in range(len(self.counts))], list(self.counts)
+
+        if resolution == "week":
+            bounds = list(range(0, len(self.counts), 7))
+        elif resolution == "month":
+            # Index of the first day of every month inside the series
+            bounds = [0] + [i for i in range(1, len(self.counts)) if self.day(i).day == 1]
+        else:
+            raise ValueError(f"Unknown activity resolution: {resolution}")
+
+        ends = bounds[1:] + [len(self.counts)]
+        labels = [self.day(start) for start in bounds]
+        values = [sum(self.counts[start:stop]) for start, stop in zip(bounds, ends)]
+        return labels, values
+
+
+def fetch_calendar(session, username, start, end):
+    """{date: contributions} from the contribution calendar, one query per year"""
+    day_counts = {}
+    chunk_start = start
+    while chunk_start <= end:
+        chunk_end = min(chunk_start + datetime.timedelta(days=CALENDAR_CHUNK_DAYS - 1), end)
+        variables = {
+            'login': username,
+            'from': f"{chunk_start.isoformat()}T00:00:00Z",
+            'to': f"{chunk_end.isoformat()}T23:59:59Z",
+        }
+        calendar = graphql(session, CALENDAR_QUERY, variables)['user']['contributionsCollection']['contributionCalendar']
+        for week in calendar['weeks']:
+            for day in week['contributionDays']:
+                day_counts[datetime.date.fromisoformat(day['date'])] = day['contributionCount']
+        chunk_start = chunk_end + datetime.timedelta(days=1)
+    return day_counts
+
+
+def load_activity_series(session, username, days, events, token=None, source=ACTIVITY_SOURCE, history=None):
+    """Daily activity for the last days + 1 days; falls back to push events
+
+    With a history store the fallback also covers pushes recorded by earlier
+    runs, not just the ~90 days the events API still returns.
+    """
+    end = datetime.datetime.now().date()
+    start = end - datetime.timedelta(days=days)
+
+    # GraphQL needs a token; anonymous runs go straight to the events API
+    if source == "calendar" and token:
+        try:
+            return ActivitySeries.from_days(start, end, fetch_calendar(session, username, start, end))
+        except Exception as e:
+            print(f"Contribution calendar unavailable, using events instead: {e}")
+
+    day_counts = events().daily_commits()
+    if history is not None:
+        # Loading the events recorded them, so history is a superset
+        day_counts = history.daily_commits(username, start)
+    return ActivitySeries.from_days(start, end, day_counts)
+
+
+def render_activity_graph(series, resolution="day", height=GRAPH_HEIGHT):
+    labels, values = series.bucket(resolution)
+    width = len(values)
+
+    # Normalize to 0-height like a GitHub-style graph
+    peak = max(values, default=0) or 1
+    levels = [min(height, int((count / peak) * height)) for count in values]
+
+    # One join per row, top to bottom
+    rows = ["".join("█" if level >= h else " " for level in levels) for h in range(height, 0, -1)]
+    rows.append("─" * width)
+
+    first, last = labels[0].strftime('%Y-%m-%d'), labels[-1].strftime('%Y-%m-%d')
+    rows.append(f"{first}{''.center(max(width - 20, 1))}{last}")
+    return "\n".join(rows)
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Offline performance benchmark for the README generator
+Runs update_readme.py against the fake GitHub API for synthetic accounts of
+different sizes and reports wall time, peak memory and requests per endpoint,
+for the full template and for each section on its own
+"""
+
+import os
+import sys
+import json
+import shutil
+import argparse
+import tempfile
+import subprocess
+
+from fake_github import FakeGitHub, SyntheticAccount
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPT_PATH = os.path.join(SCRIPT_DIR, "update_readme.py")
+DEFAULT_TEMPLATE = os.path.join(SCRIPT_DIR, "..", "README.template.md")
+
+# Runs the generator in a fresh interpreter and records its own wall time and
+# peak RSS, so runs do not share imports, caches or memory
+BOOTSTRAP = """
+import json, os, resource, runpy, sys, time
+sys.path.insert(0, sys.argv[1])
+sys.argv = [sys.argv[2]]
+start = time.perf_counter()
+runpy.run_path(sys.argv[0], run_name='__main__')
+seconds = time.perf_counter() - start
+peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+with open(os.environ['BENCH_RESULT'], 'w') as file:
+    json.dump({'seconds': seconds, 'peak_kb': peak_kb}, file)
+"""
+
+
+# Renders once through the webhook service, applies a star delivery, renders
+# again and reports what the second README still leaves unfilled
+WEBHOOK_BOOTSTRAP = """
+import json, os, re, sys
+sys.path.insert(0, sys.argv[1])
+import webhook_server
+output = os.environ['README_OUTPUT']
+username = os.environ['GITHUB_USERNAME']
+service = webhook_server.ReadmeService(username, os.environ['README_TEMPLATE'], output, debounce=3600)
+service.render()
+before = service.evaluation.values.get('repo_stats_section', {}).get('STAR_COUNT')
+service.handle('star', {'action': 'created', 'repository': {'owner': {'login': username}}})
+service.render()
+with open(output, 'r', encoding='utf-8') as file:
+    text = file.read()
+after = service.evaluation.values.get('repo_stats_section', {}).get('STAR_COUNT')
+with open(os.environ['BENCH_RESULT'], 'w') as file:
+    json.dump({'unfilled': re.findall(r'{{ *([A-Z0-9_]+) *}}', text), 'stars': [before, after]}, file)
+"""
+
+
+# Learning-focus scores that must hold: an indicator inside a keyword's own
+# name is no bonus, and short keywords don't match inside longer words
+KEYWORD_SCORING_CASES = {
+    "machine-learning": {'AI/ML': 1},
+    "deep-learning": {'AI/ML': 1},
+    "I build a yaml and html guide. Exploring": {},
+}
+
+
+def check_keyword_scoring():
+    """Raises if the learning matcher scores a known case differently"""
+    from update_readme import learning_matcher
+    for text, expected in KEYWORD_SCORING_CASES.items():
+        scores = dict(learning_matcher.score(text))
+        if scores != expected:
+            raise RuntimeError(f"Learning focus for {text!r} scored {scores}, expected {expected}")
+
+
+def discover_sections():
+    """Map each registered section to the placeholders it fills"""
+    # Importing the generator has no side effects; clients are created on use
+    from update_readme import sections
+    return {name: list(node.provides) for name, node in sections.nodes.items() if node.provides}
+
+
+def generator_env(server, template_text, workdir, backend="rest"):
+    """Environment pointing the generator at the fake API, with all state in workdir"""
+    template_path = os.path.join(workdir, "README.template.md")
+    with open(template_path, 'w') as file:
+        file.write(template_text)
+
+    run_env = dict(os.environ)
+    run_env.update({
+        "GITHUB_API_URL": server.url,
+        "GH_TOKEN": "benchmark-token",
+        "GITHUB_USERNAME": server.server.account.username,
+        "README_TEMPLATE": template_path,
+        "README_OUTPUT": os.path.join(workdir, "README.md"),
+        "README_CACHE_DIR": os.path.join(workdir, "cache"),
+        "README_SNAPSHOT_PATH": os.path.join(workdir, "repo-snapshot.json"),
+        "README_METRICS_PATH": os.path.join(workdir, "metrics.json"),
+        "README_BACKEND": backend,
+        # Measure the render itself, not the pre-flight skip
+        "README_FORCE_REFRESH": "1",
+        "BENCH_RESULT": os.path.join(workdir, "result.json"),
+    })
+    return run_env
+
+
+def run_generator(server, template_text, workdir, backend="rest", env=None):
+    """One generator run in workdir; returns timing, memory and request counts"""
+    run_env = generator_env(server, template_text, workdir, backend)
+    run_env.update(env or {})
+    result_path = run_env["BENCH_RESULT"]
+
+    server.reset_counts()
+    completed = subprocess.run([sys.executable, "-c", BOOTSTRAP, SCRIPT_DIR, SCRIPT_PATH],
+                               cwd=workdir, env=run_env, capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise RuntimeError(f"Generator failed:\n{completed.stderr[-2000:]}")
+
+    with open(result_path, 'r') as file:
+        result = json.load(file)
+    counts = server.counts
+    result['requests'] = sum(counts.values())
+    result['endpoints'] = dict(counts.most_common())
+
+    # The generator's own per-section breakdown of the same run
+    with open(os.path.join(workdir, "metrics.json"), 'r') as file:
+        result['metrics'] = json.load(file)['sections']
+    return result
+
+
+def check_webhook_rerender(server, template_text, workdir, backend="rest"):
+    """Raises if a webhook re-render leaves placeholders unfilled or drops a patched value"""
+    run_env = generator_env(server, template_text, workdir, backend)
+    completed = subprocess.run([sys.executable, "-c", WEBHOOK_BOOTSTRAP, SCRIPT_DIR],
+                               cwd=workdir, env=run_env, capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise RuntimeError(f"Webhook service failed:\n{completed.stderr[-2000:]}")
+
+    with open(run_env["BENCH_RESULT"], 'r') as file:
+        result = json.load(file)
+    if result['unfilled']:
+        raise RuntimeError(f"Webhook re-render left placeholders unfilled: {', '.join(result['unfilled'])}")
+    before, after = result['stars']
+    if before is not None and int(after) != int(before) + 1:
+        raise RuntimeError(f"Webhook re-render lost the patched STAR_COUNT: {before} -> {after}")
+    return result
+
+
+def benchmark_account(account, template_text, backend="rest", warm=False, per_section=True, webhook=False):
+    report = {'repos': len(account.repos), 'events': len(account.events), 'backend': backend}
+    workdir = tempfile.mkdtemp(prefix="readme-bench-")
+    try:
+        with FakeGitHub(account) as server:
+            report['full'] = run_generator(server, template_text, workdir, backend)
+            if warm:
+                # Same cache and snapshot as the cold run: the incremental path
+                report['warm'] = run_generator(server, template_text, workdir, backend)
+            if webhook:
+                webhook_dir = os.path.join(workdir, "webhook")
+                os.makedirs(webhook_dir)
+                report['webhook'] = check_webhook_rerender(server, template_text, webhook_dir, backend)
+
+            report['sections'] = {}
+            if per_section:
+                for name, keys in discover_sections().items():
+                    section_dir = os.path.join(workdir, name)
+                    os.makedirs(section_dir)
+                    text = "\n".join(f"{{{{ {key} }}}}" for key in keys)
+                    report['sections'][name] = run_generator(server, text, section_dir, backend)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return report
+
+
+def format_row(label, result):
+    return f"  {label:<28} {result['seconds']:>8.2f}s {result['peak_kb'] / 1024:>8.1f} MiB {result['requests']:>8}"
+
+
+def print_report(report, top_endpoints=8):
+    print(f"\n{report['repos']} repos, {report['events']} events ({report['backend']} backend)")
+    print(f"  {'run':<28} {'wall':>9} {'peak':>12} {'requests':>8}")
+    print(format_row("full template", report['full']))
+    if 'warm' in report:
+        print(format_row("full template (warm)", report['warm']))
+    if 'webhook' in report:
+        before, after = report['webhook']['stars']
+        print(f"  webhook re-render: every placeholder filled, STAR_COUNT {before} -> {after}")
+    for name, result in sorted(report['sections'].items(), key=lambda item: -item[1]['seconds']):
+        print(format_row(name, result))
+
+    print("  busiest endpoints (full template):")
+    for endpoint, count in list(report['full']['endpoints'].items())[:top_endpoints]:
+        print(f"    {count:>6}  {endpoint}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the README generator against a fake GitHub API")
+    parser.add_argument('--repos', type=int, nargs='+', default=[10, 100, 1000])
+    parser.add_argument('--events', type=int, default=300)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--backend', choices=['rest', 'graphql'], default='rest')
+    parser.add_argument('--template', default=DEFAULT_TEMPLATE)
+    parser.add_argument('--fixtures', help="benchmark a recorded account instead of synthetic ones")
+    parser.add_argument('--warm', action='store_true', help="also measure a second run with a warm cache")
+    parser.add_argument('--no-sections', action='store_true', help="skip the per-section runs")
+    parser.add_argument('--webhook', action='store_true',
+                        help="also check that a webhook re-render fills every placeholder")
+    parser.add_argument('--json', help="write the full report to this file")
+    args = parser.parse_args()
+
+    # Cheap correctness checks first, so a broken matcher fails fast
+    check_keyword_scoring()
+
+    with open(args.template, 'r', encoding='utf-8') as file:
+        template_text = file.read()
+
+    if args.fixtures:
+        with open(args.fixtures, 'r') as file:
+            accounts = [SyntheticAccount.from_json(file.read())]
+    else:
+        accounts = [SyntheticAccount(repos=count, events=args.events, seed=args.seed) for count in args.repos]
+
+    reports = []
+    for account in accounts:
+        report = benchmark_account(account, template_text, args.backend, args.warm, not args.no_sections, args.webhook)
+        print_report(report)
+        reports.append(report)
+
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump(reports, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Run deadlines and per-section time budgets
+The active deadline lives in a context variable, so it follows sections into
+their worker threads; every request is refused once it has passed and its
+timeout is capped to the time that is left
+"""
+
+import os
+import time
+import contextlib
+import contextvars
+
+# Whole run (or one webhook re-render), and each section within it
+RUN_DEADLINE_SECONDS = float(os.environ.get("README_RUN_DEADLINE", "600"))
+SECTION_BUDGET_SECONDS = float(os.environ.get("README_SECTION_BUDGET", "180"))
+
+# (connect, read) seconds for a single request
+REQUEST_TIMEOUT = (
+    float(os.environ.get("README_CONNECT_TIMEOUT", "5")),
+    float(os.environ.get("README_READ_TIMEOUT", "30")),
+)
+
+current_deadline = contextvars.ContextVar('current_deadline', default=None)
+
+
+class DeadlineExceeded(Exception):
+    pass
+
+
+@contextlib.contextmanager
+def deadline(seconds):
+    """Run the block under a deadline; an enclosing, earlier deadline still wins"""
+    outer = current_deadline.get()
+    at = time.monotonic() + seconds
+    token = current_deadline.set(at if outer is None else min(outer, at))
+    try:
+        yield
+    finally:
+        current_deadline.reset(token)
+
+
+def remaining():
+    """Seconds left before the active deadline, or None without one"""
+    at = current_deadline.get()
+    if at is None:
+        return None
+    return at - time.monotonic()
+
+
+def expired():
+    left = remaining()
+    return left is not None and left <= 0
+
+
+def check(what="request"):
+    if expired():
+        raise DeadlineExceeded(f"Deadline passed before {what}")
+
+
+def bounded_timeout(timeout=None):
+    """Request timeout capped so it can't outlive the active deadline"""
+    timeout = timeout or REQUEST_TIMEOUT
+    left = remaining()
+    if left is None:
+        return timeout
+    left = max(left, 0.01)
+    if isinstance(timeout, tuple):
+        return tuple(min(part, left) for part in timeout)
+    return min(timeout, left)
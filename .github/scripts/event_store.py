@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+In-memory store for a user's public events
+Fetched once per run and shared by every section that reads the events API
+"""
+
+import datetime
+from collections import defaultdict
+
+from github_api import api_url, get_paginated
+
+# The events API never returns more than 300 events (3 pages of 100)
+EVENTS_PER_PAGE = 100
+EVENTS_MAX_PAGES = 3
+
+
+class EventStore:
+    def __init__(self, events):
+        self.events = []
+        self.by_type = defaultdict(list)
+        self.by_repo = defaultdict(list)
+        self.by_day = defaultdict(list)
+
+        for event in events:
+            self.add(event)
+
+    @classmethod
+    def fetch(cls, session, username):
+        url = api_url(f'users/{username}/events')
+        events = get_paginated(session, url, params={'per_page': EVENTS_PER_PAGE},
+                               max_pages=EVENTS_MAX_PAGES)
+        return cls(events)
+
+    def add(self, event):
+        # Parse the timestamp once instead of once per section
+        created = datetime.datetime.strptime(event['created_at'], '%Y-%m-%dT%H:%M:%SZ')
+        event['created'] = created
+
+        self.events.append(event)
+        self.by_type[event['type']].append(event)
+        self.by_repo[event['repo']['name']].append(event)
+        self.by_day[created.date()].append(event)
+
+    def of_type(self, event_type):
+        return self.by_type.get(event_type, [])
+
+    def repo_names(self):
+        return self.by_repo.keys()
+
+    def commits_on(self, day):
+        return sum(len(event['payload'].get('commits', []))
+                   for event in self.by_day.get(day, []) if event['type'] == 'PushEvent')
+
+    def daily_commits(self):
+        return {day: self.commits_on(day) for day in self.by_day}
+
+    def push_commit_count(self):
+        return sum(len(event['payload'].get('commits', [])) for event in self.of_type('PushEvent'))
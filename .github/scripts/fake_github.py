@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+"""
+Offline stand-in for the GitHub API
+Serves synthetic (or recorded) fixtures for every endpoint the README
+generator touches, with ETags, Link pagination and rate-limit headers, and
+counts requests per endpoint so runs can be measured without network
+"""
+
+import re
+import sys
+import json
+import base64
+import random
+import hashlib
+import argparse
+import datetime
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+DATE_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+LANGUAGES = ['Python', 'JavaScript', 'TypeScript', 'Go', 'Java', 'Shell']
+
+# Per-repo file sets the synthetic repos are drawn from
+FILE_SETS = [
+    {
+        'package.json': json.dumps({'dependencies': {'react': '^18.0.0', 'next': '^14.0.0'},
+                                    'devDependencies': {'jest': '^29.0.0', 'webpack': '^5.0.0'}}),
+        'tsconfig.json': '{}',
+        'README.md': 'A web dashboard. Currently learning react-native and exploring graphql.',
+    },
+    {
+        'requirements.txt': 'django\npytest\n',
+        'Dockerfile': 'FROM python:3.12',
+        '.github/workflows/ci.yml': 'on: push',
+        'README.md': 'Backend service. Experimenting with kubernetes and terraform on aws.',
+    },
+    {
+        'pyproject.toml': '[project]\ndependencies = ["torch", "flask"]\n',
+        'README.md': 'Studying machine-learning: neural nets with pytorch.',
+    },
+    {
+        'services/api/package.json': json.dumps({'dependencies': {'express': '^4.0.0'}}),
+        'infra/main.tf': 'provider "aws" {}',
+        'docker-compose.yml': 'services: {}',
+        'readme.md': 'Monorepo for a game built with godot and a node api.',
+    },
+]
+
+
+def _iso(value):
+    return value.strftime(DATE_FORMAT)
+
+
+def _blob_sha(text):
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+class SyntheticAccount:
+    """Deterministic fake account: repos with files and languages plus an events feed"""
+
+    def __init__(self, username='centopw', repos=10, events=300, seed=1, now=None):
+        rng = random.Random(seed)
+        now = (now or datetime.datetime.utcnow()).replace(microsecond=0)
+        self.username = username
+        self.created_at = _iso(now - datetime.timedelta(days=3000))
+        self.updated_at = _iso(now)
+        self.pr_count = rng.randint(10, 200)
+        self.issue_count = rng.randint(5, 100)
+
+        names = ['tanhiep.dev', 'ai-experiments', 'react-components', 'dev-dashboard']
+        names += [f'project-{i}' for i in range(max(repos - len(names), 0))]
+        self.repos = []
+        for i, name in enumerate(names[:repos]):
+            pushed = now - datetime.timedelta(hours=rng.randint(1, 24 * 400))
+            language = rng.choice(LANGUAGES)
+            self.repos.append({
+                'id': 1000 + i,
+                'node_id': f'R_{1000 + i}',
+                'name': name,
+                'full_name': f'{username}/{name}',
+                'owner': {'login': username},
+                'private': False,
+                'fork': i > 3 and i % 9 == 0,
+                'language': language,
+                'stargazers_count': rng.randint(0, 50),
+                'created_at': _iso(pushed - datetime.timedelta(days=rng.randint(1, 900))),
+                'updated_at': _iso(pushed),
+                'pushed_at': _iso(pushed),
+                'default_branch': 'main',
+                'languages': {language: rng.randint(1_000, 500_000), 'Shell': rng.randint(0, 5_000)},
+                'commit_count': rng.randint(1, 400),
+                'files': dict(FILE_SETS[i % len(FILE_SETS)]),
+            })
+
+        self.events = []
+        for i in range(events):
+            repo = rng.choice(self.repos) if self.repos else None
+            event_type = rng.choice(['PushEvent', 'PushEvent', 'PushEvent', 'WatchEvent', 'CreateEvent'])
+            repo_name = repo['full_name'] if repo and i % 13 else f'other-org/shared-{i % 5}'
+            payload = {'commits': [{'sha': f'{i:040x}'}] * rng.randint(1, 5)} if event_type == 'PushEvent' else {}
+            self.events.append({
+                'id': str(10_000 + i),
+                'type': event_type,
+                'repo': {'name': repo_name},
+                'created_at': _iso(now - datetime.timedelta(hours=i * 7)),
+                'payload': payload,
+            })
+
+    def to_json(self):
+        return json.dumps(self.__dict__)
+
+    @classmethod
+    def from_json(cls, text):
+        account = cls.__new__(cls)
+        account.__dict__.update(json.loads(text))
+        return account
+
+    def repo(self, name):
+        return next((repo for repo in self.repos if repo['name'] == name), None)
+
+    def public_repo(self, repo):
+        return {key: value for key, value in repo.items() if key not in ('languages', 'commit_count', 'files')}
+
+    def commits(self, repo):
+        # Newest first, one commit per day going back from pushed_at
+        pushed = datetime.datetime.strptime(repo['pushed_at'], DATE_FORMAT)
+        commits = []
+        for i in range(repo['commit_count']):
+            date = _iso(pushed - datetime.timedelta(days=i))
+            person = {'name': self.username, 'email': f'{self.username}@example.com', 'date': date}
+            commits.append({'sha': hashlib.sha1(f"{repo['id']}-{i}".encode()).hexdigest(),
+                            'commit': {'author': person, 'committer': person, 'message': f'Commit {i}'}})
+        return commits
+
+
+class FakeGitHubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    server_version = 'FakeGitHub/1.0'
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def account(self):
+        return self.server.account
+
+    def _count(self, method, path):
+        endpoint = re.sub(r'^/repos/[^/]+/[^/]+', '/repos/{owner}/{repo}', path)
+        endpoint = re.sub(r'^/users/[^/]+', '/users/{username}', endpoint)
+        endpoint = re.sub(r'/contents/.+$', '/contents/{path}', endpoint)
+        endpoint = re.sub(r'/(commits|trees|blobs)/[^/]+$', r'/\1/{ref}', endpoint)
+        with self.server.lock:
+            self.server.counts[f'{method} {endpoint}'] += 1
+
+    def _send_json(self, payload, status=200, headers=None, resource='core'):
+        body = json.dumps(payload).encode('utf-8')
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        not_modified = status == 200 and self.headers.get('If-None-Match') == etag
+
+        with self.server.lock:
+            # Conditional hits are free, as on the real API
+            if not not_modified:
+                self.server.used[resource] += 1
+            remaining = max(self.server.limits[resource] - self.server.used[resource], 0)
+
+        self.send_response(304 if not_modified else status)
+        self.send_header('ETag', etag)
+        self.send_header('X-RateLimit-Resource', resource)
+        self.send_header('X-RateLimit-Limit', str(self.server.limits[resource]))
+        self.send_header('X-RateLimit-Remaining', str(remaining))
+        self.send_header('X-RateLimit-Used', str(self.server.used[resource]))
+        self.send_header('X-RateLimit-Reset', str(int(self.server.reset_at)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if not_modified:
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _not_found(self):
+        self._send_json({'message': 'Not Found'}, status=404)
+
+    def _send_page(self, items, query):
+        per_page = int(query.get('per_page', ['30'])[0])
+        page = int(query.get('page', ['1'])[0])
+        last = max(1, -(-len(items) // per_page))
+
+        base = f"http://{self.headers['Host']}{urlparse(self.path).path}"
+        extra = ''.join(f'&{key}={values[0]}' for key, values in query.items() if key not in ('page', 'per_page'))
+        links = []
+        if page < last:
+            links.append(f'<{base}?per_page={per_page}{extra}&page={page + 1}>; rel="next"')
+            links.append(f'<{base}?per_page={per_page}{extra}&page={last}>; rel="last"')
+        headers = {'Link': ', '.join(links)} if links else None
+        self._send_json(items[(page - 1) * per_page:page * per_page], headers=headers)
+
+    def _content_entry(self, repo, path, with_content=True):
+        text = repo['files'][path]
+        entry = {'type': 'file', 'name': path.rsplit('/', 1)[-1], 'path': path, 'sha': _blob_sha(text),
+                 'size': len(text), 'url': '', 'html_url': '', 'git_url': '', 'download_url': ''}
+        if with_content:
+            entry['encoding'] = 'base64'
+            entry['content'] = base64.b64encode(text.encode('utf-8')).decode('ascii')
+        return entry
+
+    def _directory(self, repo, directory):
+        prefix = f'{directory}/' if directory else ''
+        entries = {}
+        for path in repo['files']:
+            if not path.startswith(prefix):
+                continue
+            head, _, rest = path[len(prefix):].partition('/')
+            if rest:
+                entries.setdefault(head, {'type': 'dir', 'name': head, 'path': prefix + head, 'sha': _blob_sha(prefix + head),
+                                          'size': 0, 'url': '', 'html_url': '', 'git_url': '', 'download_url': None})
+            else:
+                entries[head] = self._content_entry(repo, path, with_content=False)
+        return list(entries.values())
+
+    def _tree(self, repo):
+        tree = []
+        directories = set()
+        for path, text in repo['files'].items():
+            parts = path.split('/')
+            for depth in range(1, len(parts)):
+                directories.add('/'.join(parts[:depth]))
+            tree.append({'path': path, 'mode': '100644', 'type': 'blob', 'sha': _blob_sha(text), 'size': len(text)})
+        tree.extend({'path': path, 'mode': '040000', 'type': 'tree', 'sha': _blob_sha(path)} for path in sorted(directories))
+        return {'sha': _blob_sha(repo['full_name']), 'truncated': False, 'tree': tree}
+
+    def _repo_route(self, repo, rest, query):
+        if rest == '':
+            return self._send_json(self.account.public_repo(repo))
+        if rest == '/languages':
+            return self._send_json(repo['languages'])
+        if rest == '/readme':
+            readme = next((path for path in repo['files'] if path.lower() == 'readme.md'), None)
+            return self._send_json(self._content_entry(repo, readme)) if readme else self._not_found()
+        if rest == '/commits':
+            return self._send_page(self.account.commits(repo), query)
+
+        match = re.fullmatch(r'/commits/(.+)', rest)
+        if match:
+            return self._send_json(self.account.commits(repo)[0])
+        match = re.fullmatch(r'/git/trees/(.+)', rest)
+        if match:
+            return self._send_json(self._tree(repo))
+        match = re.fullmatch(r'/git/blobs/([0-9a-f]+)', rest)
+        if match:
+            text = next((text for text in repo['files'].values() if _blob_sha(text) == match.group(1)), None)
+            if text is None:
+                return self._not_found()
+            return self._send_json({'sha': match.group(1), 'size': len(text), 'encoding': 'base64',
+                                    'content': base64.b64encode(text.encode('utf-8')).decode('ascii')})
+        match = re.fullmatch(r'/contents/?(.*)', rest)
+        if match:
+            path = match.group(1).strip('/')
+            if path in repo['files']:
+                return self._send_json(self._content_entry(repo, path))
+            listing = self._directory(repo, path)
+            return self._send_json(listing) if listing or path == '' else self._not_found()
+        return self._not_found()
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        path = url.path
+        self._count('GET', path)
+        account = self.account
+
+        if path == '/rate_limit':
+            return self._send_json({'resources': {name: {'limit': limit, 'used': self.server.used[name]}
+                                                  for name, limit in self.server.limits.items()}})
+        if re.fullmatch(r'/users/[^/]+', path):
+            return self._send_json({'login': account.username, 'id': 1, 'type': 'User',
+                                    'created_at': account.created_at, 'updated_at': account.updated_at,
+                                    'public_repos': len(account.repos)})
+        if re.fullmatch(r'/users/[^/]+/repos', path):
+            return self._send_page([account.public_repo(repo) for repo in account.repos], query)
+        if re.fullmatch(r'/users/[^/]+/events(/public)?', path):
+            return self._send_page(account.events, query)
+        if path == '/search/issues':
+            total = account.pr_count if 'type:pr' in url.query else account.issue_count
+            return self._send_json({'total_count': total, 'incomplete_results': False, 'items': []},
+                                   resource='search')
+
+        match = re.fullmatch(r'/repos/([^/]+)/([^/]+)(/.*)?', path)
+        if match:
+            repo = account.repo(match.group(2))
+            if repo is None:
+                return self._not_found()
+            return self._repo_route(repo, match.group(3) or '', query)
+        return self._not_found()
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        self._count('POST', url.path)
+        length = int(self.headers.get('Content-Length', 0))
+        request = json.loads(self.rfile.read(length) or b'{}')
+        if url.path != '/graphql':
+            return self._not_found()
+        self._send_json({'data': self._graphql(request.get('query', ''), request.get('variables') or {})},
+                        resource='graphql')
+
+    def _graphql_repo(self, repo):
+        return {
+            'name': repo['name'],
+            'isFork': repo['fork'],
+            'stargazerCount': repo['stargazers_count'],
+            'createdAt': repo['created_at'],
+            'pushedAt': repo['pushed_at'],
+            'primaryLanguage': {'name': repo['language']},
+            'languages': {'edges': [{'size': size, 'node': {'name': name}}
+                                    for name, size in repo['languages'].items()]},
+            'defaultBranchRef': {'name': repo['default_branch'], 'target': {
+                'oid': self.account.commits(repo)[0]['sha'],
+                'authoredDate': repo['pushed_at'],
+                'committedDate': repo['pushed_at'],
+                'history': {'totalCount': repo['commit_count']},
+            }},
+        }
+
+    def _calendar(self, start, end):
+        # Push commits from the events feed plus a deterministic background
+        pushes = Counter()
+        for event in self.account.events:
+            if event['type'] == 'PushEvent':
+                pushes[event['created_at'][:10]] += len(event['payload'].get('commits', []))
+
+        weeks = []
+        day = start
+        while day <= end:
+            label = day.isoformat()
+            background = int(hashlib.md5(label.encode()).hexdigest(), 16) % 6
+            if not weeks or day.weekday() == 6:
+                weeks.append({'contributionDays': []})
+            weeks[-1]['contributionDays'].append({'date': label, 'contributionCount': pushes[label] + background})
+            day += datetime.timedelta(days=1)
+        return {'weeks': weeks}
+
+    def _graphql(self, query, variables):
+        # Only the query shapes the generator sends are understood
+        account = self.account
+        if 'contributionsCollection' in query:
+            start = datetime.date.fromisoformat(variables['from'][:10])
+            end = datetime.date.fromisoformat(variables['to'][:10])
+            return {'user': {'contributionsCollection': {'contributionCalendar': self._calendar(start, end)}}}
+        if 'repository(owner' in query:
+            result = {}
+            for key, name in variables.items():
+                if key.startswith('name'):
+                    repo = account.repo(name)
+                    result[f'r{key[4:]}'] = self._graphql_repo(repo) if repo else None
+            return result
+        if 'repositories(' in query:
+            first = variables.get('first', 50)
+            start = int(variables.get('after') or 0)
+            nodes = [self._graphql_repo(repo) for repo in account.repos[start:start + first]]
+            return {'user': {'repositories': {
+                'totalCount': len(account.repos),
+                'pageInfo': {'hasNextPage': start + first < len(account.repos), 'endCursor': str(start + first)},
+                'nodes': nodes,
+            }}}
+        return {'user': {'id': 'U_1', 'createdAt': account.created_at, 'updatedAt': account.updated_at,
+                         'pullRequests': {'totalCount': account.pr_count},
+                         'issues': {'totalCount': account.issue_count}}}
+
+
+class FakeGitHub:
+    """Threaded fake API server; use as a context manager or start()/stop()"""
+
+    def __init__(self, account, host='127.0.0.1', port=0, core_limit=5000):
+        self.server = ThreadingHTTPServer((host, port), FakeGitHubHandler)
+        self.server.daemon_threads = True
+        self.server.account = account
+        self.server.lock = threading.Lock()
+        self.server.counts = Counter()
+        self.server.limits = {'core': core_limit, 'search': 30, 'graphql': 5000}
+        self.server.used = Counter()
+        self.server.reset_at = (datetime.datetime.now() + datetime.timedelta(hours=1)).timestamp()
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    @property
+    def counts(self):
+        with self.server.lock:
+            return Counter(self.server.counts)
+
+    def reset_counts(self):
+        with self.server.lock:
+            self.server.counts.clear()
+            self.server.used.clear()
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a fake GitHub API for offline runs")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--username', default='centopw')
+    parser.add_argument('--repos', type=int, default=10)
+    parser.add_argument('--events', type=int, default=300)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--fixtures', help="serve a recorded account saved with --dump")
+    parser.add_argument('--dump', help="write the synthetic account to this file and exit")
+    args = parser.parse_args()
+
+    if args.fixtures:
+        with open(args.fixtures, 'r') as file:
+            account = SyntheticAccount.from_json(file.read())
+    else:
+        account = SyntheticAccount(args.username, repos=args.repos, events=args.events, seed=args.seed)
+
+    if args.dump:
+        with open(args.dump, 'w') as file:
+            file.write(account.to_json())
+        return
+
+    server = FakeGitHub(account, port=args.port)
+    print(f"Fake GitHub API for {account.username} ({len(account.repos)} repos) on {server.url}")
+    print(f"Run with GITHUB_API_URL={server.url}")
+    try:
+        server.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server.server_close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Figlet banners memoized on disk
+The banner only changes with its text and font, so pyfiglet is imported and
+run once per (text, font) instead of on every run
+"""
+
+import os
+import json
+import threading
+
+from json_file import atomic_write_json
+
+DEFAULT_FIGLET_CACHE_PATH = os.environ.get("README_FIGLET_CACHE_PATH", ".cache/figlet.json")
+
+
+class FigletCache:
+    def __init__(self, path=DEFAULT_FIGLET_CACHE_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        self.changed = False
+
+        try:
+            with open(path, 'r') as file:
+                self.banners = json.load(file)
+        except (OSError, ValueError):
+            self.banners = {}
+
+    @staticmethod
+    def key_for(text, font):
+        # JSON object keys must be strings
+        return f"{font}\n{text}"
+
+    def render(self, text, font):
+        key = self.key_for(text, font)
+        with self.lock:
+            if key in self.banners:
+                return self.banners[key]
+
+        import pyfiglet
+        banner = pyfiglet.figlet_format(text, font=font)
+        with self.lock:
+            self.banners[key] = banner
+            self.changed = True
+        return banner
+
+    def save(self):
+        with self.lock:
+            if not self.changed:
+                return
+            atomic_write_json(self.path, self.banners)
+            self.changed = False
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Shared GitHub REST plumbing for the README generator
+One pooled keep-alive session per run instead of a bare requests.get per call
+"""
+
+import os
+from requests.adapters import HTTPAdapter
+
+import deadline
+from http_cache import CachedSession
+from metrics import InstrumentedSession
+from rate_limit import ScheduledSession
+
+API_URL = os.environ.get("GITHUB_API_URL", "https://api.github.com").rstrip("/")
+
+
+class GitHubError(Exception):
+    pass
+
+
+class GitHubSession(InstrumentedSession, CachedSession, ScheduledSession):
+    # Cache lookups wrap the scheduler, so a 304 replay still goes through
+    # admission control and every retry re-sends the conditional headers.
+    # Metrics sit outermost so they see whether a response came from the cache,
+    # and the scheduler hands them every attempt it retries
+
+    def send(self, request, **kwargs):
+        # No request may hang past the run or section deadline
+        deadline.check(f"{request.method} {request.url}")
+        kwargs['timeout'] = deadline.bounded_timeout(kwargs.get('timeout'))
+        return super().send(request, **kwargs)
+
+
+def create_session(token, pool_size=10, cache=None, scheduler=None, metrics=None):
+    session = GitHubSession(metrics=metrics, cache=cache, scheduler=scheduler)
+    session.headers.update({'Accept': 'application/vnd.github.v3+json'})
+    if token:
+        session.headers['Authorization'] = f'token {token}'
+
+    # Keep connections alive across every section of the run
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def create_github_client(token, session):
+    """PyGithub client that sends every request through the shared session"""
+    # PyGithub is slow to import and only a few sections need it
+    from github import Auth, Github
+    from github.Requester import HTTPSRequestsConnectionClass, Requester
+
+    class SharedHTTPSConnection(HTTPSRequestsConnectionClass):
+        # Mimics PyGithub's connection but reuses our pool and cache instead of
+        # building a fresh requests.Session per connection
+        def __init__(self, host, port=None, strict=False, timeout=None, retry=None, pool_size=None, **kwargs):
+            self.host = host
+            self.port = port if port else 443
+            self.protocol = "https"
+            self.timeout = timeout
+            self.verify = kwargs.get("verify", True)
+            self.session = session
+
+        def close(self):
+            pass
+
+    class SharedHTTPConnection(SharedHTTPSConnection):
+        def __init__(self, host, port=None, **kwargs):
+            super().__init__(host, port if port else 80, **kwargs)
+            self.protocol = "http"
+
+    Requester.injectConnectionClasses(SharedHTTPConnection, SharedHTTPSConnection)
+    auth = Auth.Token(token) if token else None
+    return Github(auth=auth, base_url=API_URL)
+
+
+def api_url(path):
+    return f"{API_URL}/{path.lstrip('/')}"
+
+
+def check_response(response):
+    """Fail loudly instead of parsing a 403/404/5xx error body as data"""
+    if not response.ok:
+        raise GitHubError(f"{response.request.method} {response.url} returned {response.status_code}: {response.text[:200]}")
+    return response
+
+
+def get_json(session, url, params=None):
+    return check_response(session.get(url, params=params)).json()
+
+
+def get_paginated(session, url, params=None, max_pages=None):
+    """Yield every item of a list endpoint, following Link rel="next" headers"""
+    pages = 0
+    while url:
+        response = check_response(session.get(url, params=params))
+        items = response.json()
+        if not isinstance(items, list):
+            return
+        yield from items
+
+        pages += 1
+        if max_pages is not None and pages >= max_pages:
+            return
+
+        # The next link already carries the query string
+        url = response.links.get('next', {}).get('url')
+        params = None
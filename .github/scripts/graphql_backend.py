@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+GraphQL data backend for the profile stats
+Pulls repos, stars, language bytes, head commit dates and PR/issue totals in a
+few paginated batched queries instead of hundreds of REST calls
+"""
+
+import datetime
+
+from github_api import API_URL, check_response
+from language_stats import LanguageStats
+
+GRAPHQL_URL = f"{API_URL}/graphql"
+
+# Keep pages small enough that the per-repo history counts don't time out
+REPOS_PER_PAGE = 50
+
+USER_QUERY = """
+query($login: String!) {
+  user(login: $login) {
+    id
+    createdAt
+    pullRequests { totalCount }
+    issues { totalCount }
+  }
+}
+"""
+
+REPOS_QUERY = """
+query($login: String!, $authorId: ID!, $after: String, $first: Int!) {
+  user(login: $login) {
+    repositories(first: $first, after: $after, ownerAffiliations: OWNER, privacy: PUBLIC,
+                 orderBy: {field: PUSHED_AT, direction: DESC}) {
+      totalCount
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        name
+        isFork
+        stargazerCount
+        createdAt
+        pushedAt
+        primaryLanguage { name }
+        languages(first: 20, orderBy: {field: SIZE, direction: DESC}) {
+          edges { size node { name } }
+        }
+        defaultBranchRef {
+          name
+          target {
+            ... on Commit {
+              oid
+              authoredDate
+              history(author: {id: $authorId}) { totalCount }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+class GraphQLError(Exception):
+    pass
+
+
+def graphql(session, query, variables):
+    response = session.post(GRAPHQL_URL, json={'query': query, 'variables': variables})
+    payload = check_response(response).json()
+    if payload.get('errors'):
+        raise GraphQLError("; ".join(error.get('message', '') for error in payload['errors']))
+    return payload['data']
+
+
+def fetch_profile_stats(session, username):
+    """Return the user record plus every owned public repository"""
+    user = graphql(session, USER_QUERY, {'login': username})['user']
+
+    repos = []
+    total_count = 0
+    after = None
+    while True:
+        variables = {'login': username, 'authorId': user['id'], 'after': after, 'first': REPOS_PER_PAGE}
+        page = graphql(session, REPOS_QUERY, variables)['user']['repositories']
+        total_count = page['totalCount']
+        repos.extend(page['nodes'])
+        if not page['pageInfo']['hasNextPage']:
+            break
+        after = page['pageInfo']['endCursor']
+
+    return {'user': user, 'repo_count': total_count, 'repos': repos}
+
+
+def _parse_date(value):
+    return datetime.datetime.strptime(value, '%Y-%m-%dT%H:%M:%SZ')
+
+
+def _head_commit(repo):
+    branch = repo.get('defaultBranchRef') or {}
+    return branch.get('target') or {}
+
+
+def stats_to_data(stats, events, site_repo):
+    """Map the GraphQL results onto the same data keys the REST sections fill"""
+    user = stats['user']
+    repos = stats['repos']
+    own_repos = [repo for repo in repos if not repo['isFork']]
+    data = {}
+
+    created = _parse_date(user['createdAt'])
+    data["DAYS_ACTIVE"] = (datetime.datetime.now() - created).days
+    data["REPO_COUNT"] = stats['repo_count']
+    data["STAR_COUNT"] = sum(repo['stargazerCount'] for repo in repos)
+    data["PR_COUNT"] = str(user['pullRequests']['totalCount'])
+    data["ISSUE_COUNT"] = str(user['issues']['totalCount'])
+
+    # Same shape as the REST count: recent pushes plus authored history per repo
+    commit_count = events.push_commit_count()
+    for repo in own_repos:
+        history = _head_commit(repo).get('history') or {}
+        commit_count += history.get('totalCount', 0)
+    data["COMMIT_COUNT"] = str(commit_count)
+
+    # Same weighting as analyze_repo_languages
+    languages = LanguageStats()
+    for repo in own_repos:
+        primary = (repo['primaryLanguage'] or {}).get('name')
+        pushed_at = _parse_date(repo['pushedAt']).replace(tzinfo=datetime.timezone.utc) if repo['pushedAt'] else None
+        languages.add({edge['node']['name']: edge['size'] for edge in repo['languages']['edges']},
+                      primary=primary, pushed_at=pushed_at)
+    data["LANGUAGES"] = ", ".join(languages.ranking(5))
+
+    site = next((repo for repo in repos if repo['name'] == site_repo), None)
+    authored = _head_commit(site).get('authoredDate') if site else None
+    data["SITE_COMMIT"] = _parse_date(authored).strftime("%b %d") if authored else "N/A"
+
+    return data
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Latest-commit lookups that cost one request per branch, or one GraphQL query
+for a whole batch of repos, no matter how long the history is
+"""
+
+import datetime
+
+from github_api import api_url, check_response
+from graphql_backend import graphql
+from repo_pool import map_repos
+
+
+def _parse_date(value):
+    return datetime.datetime.strptime(value, '%Y-%m-%dT%H:%M:%SZ')
+
+
+def latest_commit_date(session, full_name, branch=None):
+    """Author date of the head commit, or None if the repo has no commits"""
+    params = {'per_page': 1}
+    if branch:
+        params['sha'] = branch
+    response = session.get(api_url(f"repos/{full_name}/commits"), params=params)
+    if response.status_code in (404, 409):  # missing or empty repository
+        return None
+    commits = check_response(response).json()
+    if not commits:
+        return None
+    return _parse_date(commits[0]['commit']['author']['date'])
+
+
+def _graphql_dates(session, full_names):
+    fields = []
+    variables = {}
+    for i, full_name in enumerate(full_names):
+        owner, name = full_name.split('/', 1)
+        variables[f'owner{i}'] = owner
+        variables[f'name{i}'] = name
+        fields.append(f"r{i}: repository(owner: $owner{i}, name: $name{i}) "
+                      "{ defaultBranchRef { target { ... on Commit { authoredDate } } } }")
+
+    params = ", ".join(f"$owner{i}: String!, $name{i}: String!" for i in range(len(full_names)))
+    query = f"query({params}) {{\n  " + "\n  ".join(fields) + "\n}"
+    result = graphql(session, query, variables)
+
+    dates = {}
+    for i, full_name in enumerate(full_names):
+        repo = result.get(f'r{i}') or {}
+        target = (repo.get('defaultBranchRef') or {}).get('target') or {}
+        dates[full_name] = _parse_date(target['authoredDate']) if target.get('authoredDate') else None
+    return dates
+
+
+def latest_commit_dates(session, full_names, use_graphql=True):
+    """Map "owner/name" to its head-commit date in one batch"""
+    full_names = list(dict.fromkeys(full_names))
+    if not full_names:
+        return {}
+
+    if use_graphql:
+        try:
+            return _graphql_dates(session, full_names)
+        except Exception as e:
+            print(f"Batched head-commit lookup failed, falling back to REST: {e}")
+
+    def lookup(full_name):
+        try:
+            return latest_commit_date(session, full_name)
+        except Exception as e:
+            print(f"Error getting commits for {full_name}: {e}")
+            return None
+
+    return dict(zip(full_names, map_repos(lookup, full_names)))
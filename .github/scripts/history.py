@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Local SQLite history of everything a run fetched
+Events, per-repo stats and section values are appended on every run, so
+trends, deltas and activity windows longer than the events API keeps are
+answered with indexed range queries instead of more API calls
+"""
+
+import os
+import time
+import sqlite3
+import datetime
+import threading
+
+DEFAULT_HISTORY_PATH = os.environ.get("README_HISTORY_PATH", ".cache/history.sqlite")
+
+# Section values longer than this (graphs, ASCII art) aren't worth keeping
+MAX_VALUE_LENGTH = 200
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id TEXT PRIMARY KEY,
+    username TEXT NOT NULL,
+    type TEXT NOT NULL,
+    repo TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    commits INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_by_user_time ON events (username, created_at);
+
+CREATE TABLE IF NOT EXISTS repo_stats (
+    username TEXT NOT NULL,
+    at REAL NOT NULL,
+    full_name TEXT NOT NULL,
+    stars INTEGER,
+    language TEXT,
+    commits INTEGER
+);
+CREATE INDEX IF NOT EXISTS repo_stats_by_repo_time ON repo_stats (username, full_name, at);
+
+CREATE TABLE IF NOT EXISTS section_values (
+    username TEXT NOT NULL,
+    at REAL NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS section_values_by_key_time ON section_values (username, key, at);
+"""
+
+
+def _timestamp(when):
+    return when.timestamp() if isinstance(when, datetime.datetime) else when
+
+
+class HistoryStore:
+    def __init__(self, path=DEFAULT_HISTORY_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        # Sections write from worker threads; the lock serializes them
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.executescript(SCHEMA)
+
+    def record_events(self, username, events):
+        """Append events not seen before; the events API only keeps ~90 days"""
+        rows = [(event['id'], username, event['type'], event['repo']['name'],
+                 event['created_at'], len(event['payload'].get('commits', [])))
+                for event in events]
+        with self.lock, self.db:
+            self.db.executemany("INSERT OR IGNORE INTO events VALUES (?, ?, ?, ?, ?, ?)", rows)
+
+    def record_run(self, username, values, repos=(), repo_commits=None, at=None):
+        """Append one run's section values and per-repo stats"""
+        at = at if at is not None else time.time()
+        repo_commits = repo_commits or {}
+        value_rows = [(username, at, key, str(value)) for key, value in values.items()
+                      if isinstance(value, (int, str)) and len(str(value)) <= MAX_VALUE_LENGTH]
+        repo_rows = [(username, at, repo.full_name, repo.stargazers_count, repo.language,
+                      repo_commits.get(repo.full_name)) for repo in repos]
+        with self.lock, self.db:
+            self.db.executemany("INSERT INTO section_values VALUES (?, ?, ?, ?)", value_rows)
+            self.db.executemany("INSERT INTO repo_stats VALUES (?, ?, ?, ?, ?, ?)", repo_rows)
+
+    def daily_commits(self, username, since):
+        """{date: commits pushed} for every recorded day from since on"""
+        with self.lock:
+            rows = self.db.execute(
+                "SELECT substr(created_at, 1, 10), SUM(commits) FROM events "
+                "WHERE username = ? AND type = 'PushEvent' AND created_at >= ? "
+                "GROUP BY substr(created_at, 1, 10)",
+                (username, since.isoformat())).fetchall()
+        return {datetime.date.fromisoformat(day): count for day, count in rows}
+
+    def active_days(self, username, since):
+        """Days since the given date with at least one recorded event"""
+        with self.lock:
+            (count,) = self.db.execute(
+                "SELECT COUNT(DISTINCT substr(created_at, 1, 10)) FROM events "
+                "WHERE username = ? AND created_at >= ?",
+                (username, since.isoformat())).fetchone()
+        return count
+
+    def value_series(self, username, key, since=0):
+        """[(unix time, value)] of one placeholder, oldest first"""
+        with self.lock:
+            return self.db.execute(
+                "SELECT at, value FROM section_values WHERE username = ? AND key = ? AND at >= ? ORDER BY at",
+                (username, key, _timestamp(since))).fetchall()
+
+    def value_at(self, username, key, when):
+        """The last value recorded at or before when, or None"""
+        with self.lock:
+            row = self.db.execute(
+                "SELECT value FROM section_values WHERE username = ? AND key = ? AND at <= ? "
+                "ORDER BY at DESC LIMIT 1",
+                (username, key, _timestamp(when))).fetchone()
+        return row[0] if row else None
+
+    def delta(self, username, key, current, days):
+        """How much a numeric placeholder grew over the last days; None without history"""
+        when = datetime.datetime.now() - datetime.timedelta(days=days)
+        # Before the window opened, fall back to the oldest value we have
+        old = self.value_at(username, key, when)
+        if old is None:
+            series = self.value_series(username, key)
+            old = series[0][1] if series else None
+        try:
+            return int(current) - int(old)
+        except (TypeError, ValueError):
+            return None
+
+    def repo_series(self, username, full_name, since=0):
+        """[(unix time, stars, language, commits)] of one repo, oldest first"""
+        with self.lock:
+            return self.db.execute(
+                "SELECT at, stars, language, commits FROM repo_stats "
+                "WHERE username = ? AND full_name = ? AND at >= ? ORDER BY at",
+                (username, full_name, _timestamp(since))).fetchall()
+
+    def close(self):
+        with self.lock:
+            self.db.close()
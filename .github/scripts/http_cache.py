@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Persistent ETag / Last-Modified cache for GitHub GET requests
+Unchanged resources come back as 304s, which don't count against the rate limit
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from json_file import atomic_write_json
+
+DEFAULT_CACHE_DIR = os.environ.get("README_CACHE_DIR", ".cache/github-http")
+DEFAULT_MAX_BYTES = int(os.environ.get("README_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+# The body is stored decoded, so transport headers must not be replayed
+DROPPED_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection'}
+
+
+class HTTPCache:
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(directory, 'index.json')
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        os.makedirs(directory, exist_ok=True)
+        try:
+            with open(self.index_path, 'r') as file:
+                self.index = json.load(file)
+        except (OSError, ValueError):
+            self.index = {}
+
+    @staticmethod
+    def key_for(request):
+        accept = request.headers.get('Accept', '')
+        return hashlib.sha256(f"{request.method} {request.url} {accept}".encode('utf-8')).hexdigest()
+
+    def _body_path(self, key):
+        return os.path.join(self.directory, f"{key}.body")
+
+    def lookup(self, key):
+        with self.lock:
+            entry = self.index.get(key)
+            if entry is None:
+                return None, None
+            try:
+                with open(self._body_path(key), 'rb') as file:
+                    body = file.read()
+            except OSError:
+                del self.index[key]
+                return None, None
+            entry['last_used'] = time.time()
+            return entry, body
+
+    def store(self, key, response):
+        headers = {name: value for name, value in response.headers.items()
+                   if name.lower() not in DROPPED_HEADERS}
+        body = response.content
+        entry = {
+            'status': response.status_code,
+            'headers': headers,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'size': len(body),
+            'last_used': time.time(),
+        }
+
+        with self.lock:
+            with open(self._body_path(key), 'wb') as file:
+                file.write(body)
+            self.index[key] = entry
+            self._evict()
+
+    def _evict(self):
+        # Drop least recently used entries until the cache fits its cap
+        total = sum(entry['size'] for entry in self.index.values())
+        if total <= self.max_bytes:
+            return
+        for key in sorted(self.index, key=lambda k: self.index[k]['last_used']):
+            if total <= self.max_bytes:
+                break
+            total -= self.index.pop(key)['size']
+            try:
+                os.remove(self._body_path(key))
+            except OSError:
+                pass
+
+    def save(self):
+        with self.lock:
+            self._evict()
+            atomic_write_json(self.index_path, self.index)
+
+
+class CachedSession(requests.Session):
+    """requests.Session that revalidates cached GET responses with conditional requests"""
+
+    def __init__(self, cache=None, **kwargs):
+        super().__init__(**kwargs)
+        self.cache = cache
+
+    def send(self, request, **kwargs):
+        if self.cache is None or request.method != 'GET' or kwargs.get('stream'):
+            return super().send(request, **kwargs)
+
+        key = HTTPCache.key_for(request)
+        entry, body = self.cache.lookup(key)
+        if entry is not None:
+            if entry['etag']:
+                request.headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                request.headers['If-Modified-Since'] = entry['last_modified']
+
+        response = super().send(request, **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            self.cache.hits += 1
+            return self._replay(entry, body, response)
+
+        self.cache.misses += 1
+        if response.status_code == 200 and (response.headers.get('ETag') or response.headers.get('Last-Modified')):
+            self.cache.store(key, response)
+        response.from_cache = False
+        return response
+
+    @staticmethod
+    def _replay(entry, body, not_modified):
+        response = requests.Response()
+        response.status_code = entry['status']
+        response.reason = 'OK'
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        # Keep the fresh rate-limit and date headers from the 304
+        for name, value in not_modified.headers.items():
+            if name.lower() not in DROPPED_HEADERS:
+                response.headers[name] = value
+        response._content = body
+        response.encoding = 'utf-8'
+        response.url = not_modified.url
+        response.request = not_modified.request
+        response.elapsed = not_modified.elapsed
+        response.from_cache = True
+        return response
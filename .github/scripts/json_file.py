@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+"""
+Atomic JSON writes for the on-disk caches and reports
+The data goes to a temporary file that then replaces the target, so a run
+killed mid-write leaves the previous file intact instead of a truncated one
+"""
+
+import os
+import json
+
+
+def atomic_write_json(path, data, **dump_kwargs):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as file:
+        json.dump(data, file, **dump_kwargs)
+    os.replace(tmp_path, path)
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Single-pass multi-keyword matcher for README learning-focus scoring
+All keywords and indicators are compiled into one regex and found in a single
+scan, then every keyword occurrence is scored against the indicator
+occurrences inside a fixed window around it
+"""
+
+import re
+from bisect import bisect_left
+from collections import Counter
+
+LEARNING_INDICATORS = ['learning', 'studying', 'experimenting with', 'exploring']
+
+# Characters between a keyword and an indicator that still count as "near"
+PROXIMITY_WINDOW = 100
+
+MENTION_SCORE = 1
+PROXIMITY_SCORE = 2
+
+# Keywords this short ("ai", "ui", "ios") only count as whole words, not
+# inside "build", "html" or "studios"
+WHOLE_WORD_LENGTH = 3
+
+
+class KeywordMatcher:
+    def __init__(self, areas, indicators=LEARNING_INDICATORS, window=PROXIMITY_WINDOW):
+        self.window = window
+        self.indicators = [indicator.lower() for indicator in indicators]
+        # One keyword can belong to several areas
+        self.areas = {}
+        for area, keywords in areas.items():
+            for keyword in keywords:
+                self.areas.setdefault(keyword.lower(), []).append(area)
+
+        terms = set(self.areas) | set(self.indicators)
+        # The lookahead finds every position where some term starts, so terms
+        # overlapping at different offsets ("machine-learning" and "learning")
+        # are all seen. It only reports one term per position, though, so the
+        # trie walk from there picks up every term sharing that start
+        # ("react" and "react-native")
+        self.pattern = re.compile("(?=" + "|".join(re.escape(term) for term in sorted(terms)) + ")")
+        self.trie = {}
+        for term in terms:
+            node = self.trie
+            for char in term:
+                node = node.setdefault(char, {})
+            node[None] = term
+        self.whole_words = {keyword for keyword in self.areas
+                            if len(keyword) <= WHOLE_WORD_LENGTH and keyword not in self.indicators}
+
+    @staticmethod
+    def _is_word(text, start, end):
+        return (start == 0 or not text[start - 1].isalnum()) and (end == len(text) or not text[end].isalnum())
+
+    def _terms_at(self, text, start):
+        node = self.trie
+        for char in text[start:]:
+            node = node.get(char)
+            if node is None:
+                return
+            if None in node:
+                yield node[None]
+
+    def positions(self, text):
+        """{term: [start offsets]} for every keyword and indicator in text"""
+        text = text.lower()
+        found = {}
+        for match in self.pattern.finditer(text):
+            start = match.start()
+            for term in self._terms_at(text, start):
+                if term in self.whole_words and not self._is_word(text, start, start + len(term)):
+                    continue
+                found.setdefault(term, []).append(start)
+        return found
+
+    def _near(self, keyword, keyword_positions, indicator, indicator_positions):
+        # Both lists come out of the scan in ascending order. An indicator
+        # inside the keyword itself ("learning" in "machine-learning") is
+        # part of its name, not a sign of learning
+        for position in keyword_positions:
+            end = position + len(keyword)
+            i = bisect_left(indicator_positions, position - self.window + 1)
+            while i < len(indicator_positions) and indicator_positions[i] < position + self.window:
+                start = indicator_positions[i]
+                if not (position <= start and start + len(indicator) <= end):
+                    return True
+                i += 1
+        return False
+
+    def areas_in(self, text):
+        """Areas with at least one keyword anywhere in text"""
+        found = set()
+        for term in self.positions(text):
+            found.update(self.areas.get(term, ()))
+        return found
+
+    def score(self, text):
+        """Counter of area -> score: a point per keyword mentioned, plus a bonus
+        per indicator that appears within the window of any of its mentions"""
+        found = self.positions(text)
+        indicator_positions = [(indicator, found[indicator]) for indicator in self.indicators if indicator in found]
+
+        scores = Counter()
+        for term, keyword_positions in found.items():
+            if term not in self.areas:
+                continue
+            points = MENTION_SCORE
+            points += PROXIMITY_SCORE * sum(1 for indicator, positions in indicator_positions
+                                            if self._near(term, keyword_positions, indicator, positions))
+            for area in self.areas[term]:
+                scores[area] += points
+        return scores
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Language statistics for the LANGUAGES placeholder
+Byte totals, repo counts and primary-language votes are kept apart and only
+combined by the chosen weighting, so one huge repository no longer decides
+the whole ranking
+"""
+
+import os
+import math
+import datetime
+from collections import Counter
+
+# bytes, log-bytes (per repo, so size has diminishing returns), repos
+# (how many repos use the language) or recency (log-bytes decayed by how
+# long ago the repo was pushed)
+LANGUAGE_WEIGHTING = os.environ.get("README_LANGUAGE_WEIGHTING", "log-bytes")
+RECENCY_HALF_LIFE_DAYS = float(os.environ.get("README_LANGUAGE_HALF_LIFE", "180"))
+
+WEIGHTINGS = ('bytes', 'log-bytes', 'repos', 'recency')
+
+
+class LanguageStats:
+    def __init__(self, now=None, half_life_days=RECENCY_HALF_LIFE_DAYS):
+        self.now = now or datetime.datetime.now(datetime.timezone.utc)
+        self.half_life_days = half_life_days
+        self.bytes = Counter()
+        self.repos = Counter()
+        self.primary = Counter()
+        self.log_bytes = Counter()
+        self.recent = Counter()
+
+    def add(self, breakdown, primary=None, pushed_at=None):
+        """Fold in one repo's {language: bytes} breakdown"""
+        decay = 1.0
+        if pushed_at is not None:
+            age_days = max((self.now - pushed_at).total_seconds() / 86400, 0)
+            decay = 0.5 ** (age_days / self.half_life_days)
+
+        # Every weighting is accumulated here, so ranking is a lookup
+        for language, size in breakdown.items():
+            weight = math.log1p(size)
+            self.bytes[language] += size
+            self.repos[language] += 1
+            self.log_bytes[language] += weight
+            self.recent[language] += weight * decay
+        if primary:
+            self.primary[primary] += 1
+
+    def scores(self, weighting=LANGUAGE_WEIGHTING):
+        if weighting == 'bytes':
+            return self.bytes
+        if weighting == 'log-bytes':
+            return self.log_bytes
+        if weighting == 'repos':
+            return self.repos
+        if weighting == 'recency':
+            return self.recent
+        raise ValueError(f"Unknown language weighting: {weighting} (expected one of {', '.join(WEIGHTINGS)})")
+
+    def ranking(self, limit=5, weighting=LANGUAGE_WEIGHTING):
+        """Top languages; ties go to the primary language of more repos, then to more bytes"""
+        scores = self.scores(weighting)
+        ordered = sorted(scores, key=lambda language: (scores[language], self.primary[language], self.bytes[language]),
+                         reverse=True)
+        return ordered[:limit]
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Last known good section values, persisted across runs
+A section that fails or runs out of time is rendered from here instead of
+publishing zeros or N/A over the previous README
+"""
+
+import os
+import json
+import time
+import threading
+
+from json_file import atomic_write_json
+
+DEFAULT_LAST_GOOD_PATH = os.environ.get("README_LAST_GOOD_PATH", ".cache/last-good.json")
+
+# Shown for a failed section that has never succeeded before
+MISSING_VALUE = "N/A"
+
+
+class LastGoodValues:
+    def __init__(self, path=DEFAULT_LAST_GOOD_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+
+        try:
+            with open(path, 'r') as file:
+                self.profiles = json.load(file)
+        except (OSError, ValueError):
+            self.profiles = {}
+
+    def for_profile(self, username):
+        return ProfileValues(self, username)
+
+    def save(self):
+        with self.lock:
+            atomic_write_json(self.path, self.profiles)
+
+
+class ProfileValues:
+    """The view of LastGoodValues an Evaluation uses for one profile"""
+
+    def __init__(self, store, username):
+        self.store = store
+        self.username = username
+
+    def put(self, section, value):
+        with self.store.lock:
+            sections = self.store.profiles.setdefault(self.username, {})
+            sections[section] = {'value': value, 'at': time.time()}
+
+    def get(self, section, keys):
+        with self.store.lock:
+            entry = self.store.profiles.get(self.username, {}).get(section)
+        value = dict(entry['value']) if entry else {}
+        for key in keys:
+            value.setdefault(key, MISSING_VALUE)
+        return value
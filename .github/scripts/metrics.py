@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Per-section timing and API-usage instrumentation for the README generator
+Every section and resource runs inside a named scope; every HTTP response is
+charged to the innermost scope of the thread (or pool task) that sent it
+"""
+
+import os
+import time
+import datetime
+import threading
+import contextlib
+import contextvars
+
+from json_file import atomic_write_json
+
+DEFAULT_METRICS_PATH = os.environ.get("README_METRICS_PATH", ".cache/readme-metrics.json")
+
+# Requests sent outside any section are charged here
+RUN_SCOPE = "(run)"
+
+
+class Scope:
+    def __init__(self, name, parent=None):
+        self.name = name
+        self.parent = parent
+        self.child_seconds = 0.0
+
+
+current_scope = contextvars.ContextVar('current_scope', default=None)
+
+
+class SectionStats:
+    FIELDS = ('calls', 'seconds', 'requests', 'bytes', 'cache_hits', 'cache_misses', 'errors')
+
+    def __init__(self):
+        for field in self.FIELDS:
+            setattr(self, field, 0)
+        # Units charged per rate-limit resource; revalidated 304s are free
+        self.rate_limit = {}
+        # Why the section was served its last known good value, if it was
+        self.stale = None
+
+    def as_dict(self):
+        stats = {field: getattr(self, field) for field in self.FIELDS}
+        stats['seconds'] = round(self.seconds, 4)
+        stats['rate_limit'] = dict(self.rate_limit)
+        if self.stale is not None:
+            stats['stale'] = self.stale
+        return stats
+
+
+class Metrics:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.sections = {}
+        self.started = time.perf_counter()
+
+    def _stats(self, name):
+        # Caller must hold the lock
+        if name not in self.sections:
+            self.sections[name] = SectionStats()
+        return self.sections[name]
+
+    @contextlib.contextmanager
+    def section(self, name):
+        """Time a section; time spent in nested sections is charged to them, not to this one"""
+        scope = Scope(name, current_scope.get())
+        token = current_scope.set(scope)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            current_scope.reset(token)
+            with self.lock:
+                if scope.parent is not None:
+                    scope.parent.child_seconds += elapsed
+                stats = self._stats(name)
+                stats.calls += 1
+                stats.seconds += elapsed - scope.child_seconds
+
+    def record_response(self, response):
+        scope = current_scope.get()
+        from_cache = getattr(response, 'from_cache', None)
+        # A replayed 304 only moved headers over the wire
+        if from_cache:
+            size = 0
+        else:
+            size = int(response.headers.get('Content-Length') or len(response.content))
+        resource = response.headers.get('X-RateLimit-Resource')
+
+        with self.lock:
+            stats = self._stats(scope.name if scope else RUN_SCOPE)
+            stats.requests += 1
+            stats.bytes += size
+            if from_cache is True:
+                stats.cache_hits += 1
+            elif from_cache is False:
+                stats.cache_misses += 1
+            if not response.ok:
+                stats.errors += 1
+            if resource and not from_cache and response.status_code != 304:
+                stats.rate_limit[resource] = stats.rate_limit.get(resource, 0) + 1
+
+    def mark_stale(self, name, reason):
+        with self.lock:
+            self._stats(name).stale = reason
+
+    def totals(self):
+        total = SectionStats()
+        with self.lock:
+            for stats in self.sections.values():
+                for field in SectionStats.FIELDS:
+                    if field != 'seconds':
+                        setattr(total, field, getattr(total, field) + getattr(stats, field))
+                for resource, units in stats.rate_limit.items():
+                    total.rate_limit[resource] = total.rate_limit.get(resource, 0) + units
+        total.seconds = time.perf_counter() - self.started
+        stale = [name for name, stats in self.sections.items() if stats.stale is not None]
+        if stale:
+            total.stale = ", ".join(stale)
+        return total
+
+    def report(self, **extra):
+        with self.lock:
+            sections = {name: stats.as_dict() for name, stats in self.sections.items()}
+        report = {
+            'generated_at': datetime.datetime.now(datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'totals': self.totals().as_dict(),
+            'sections': sections,
+        }
+        report.update(extra)
+        return report
+
+    def write(self, path=DEFAULT_METRICS_PATH, **extra):
+        write_report(path, self.report(**extra))
+
+    def summary_table(self):
+        with self.lock:
+            rows = [(name, stats.as_dict()) for name, stats in self.sections.items()]
+        rows.sort(key=lambda row: -row[1]['seconds'])
+        rows.append(('total', self.totals().as_dict()))
+
+        lines = [f"{'section':<26} {'seconds':>8} {'requests':>8} {'KiB':>9} {'hits':>6} {'misses':>6} {'units':>6}"]
+        for name, stats in rows:
+            units = sum(stats['rate_limit'].values())
+            lines.append(f"{name:<26} {stats['seconds']:>8.2f} {stats['requests']:>8} {stats['bytes'] / 1024:>9.1f} "
+                         f"{stats['cache_hits']:>6} {stats['cache_misses']:>6} {units:>6}"
+                         f"{'  STALE' if 'stale' in stats else ''}")
+        return "\n".join(lines)
+
+
+def write_report(path, report):
+    atomic_write_json(path, report, indent=2)
+
+
+# A mixin rather than a requests.Session subclass, so importing metrics
+# doesn't pull in requests
+class InstrumentedSession:
+    """requests.Session mixin that reports every response to a Metrics collector,
+    including attempts a ScheduledSession below it retried"""
+
+    def __init__(self, metrics=None, **kwargs):
+        super().__init__(**kwargs)
+        self.metrics = metrics
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        if self.metrics is not None:
+            self.metrics.record_response(response)
+        return response
+
+    def retried(self, response):
+        # The final response is recorded by send; this one never reaches it
+        if self.metrics is not None:
+            self.metrics.record_response(response)
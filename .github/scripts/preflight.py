@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Pre-flight fingerprint of everything a render depends on
+A handful of conditional requests (user, repo listing, latest events) plus
+hashes of the template and the generator decide whether anything changed
+since the last successful run; if not, the whole render is skipped
+"""
+
+import os
+import glob
+import json
+import hashlib
+import datetime
+import threading
+
+from github_api import api_url, check_response
+from event_store import EVENTS_PER_PAGE
+from repo_source import REPOS_PER_PAGE
+from json_file import atomic_write_json
+
+DEFAULT_FINGERPRINT_PATH = os.environ.get("README_FINGERPRINT_PATH", ".cache/fingerprints.json")
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Environment settings that change what gets rendered (not where state is
+# kept or how fast), matched by prefix
+OUTPUT_SETTING_PREFIXES = ('README_BACKEND', 'README_LANGUAGE_', 'README_ACTIVITY_', 'README_TREND_', 'README_UPTIME_')
+
+
+def _digest(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def _validator(response):
+    # The ETag survives 304 replays from the HTTP cache; hash the body otherwise
+    return response.headers.get('ETag') or response.headers.get('Last-Modified') or _digest(response.content)
+
+
+def _page_validators(session, url, params, max_pages=None):
+    # Same URLs and parameters as the real fetch, so both share cache entries
+    validators = []
+    while url and (max_pages is None or len(validators) < max_pages):
+        response = check_response(session.get(url, params=params))
+        validators.append(_validator(response))
+        url = response.links.get('next', {}).get('url')
+        params = None
+    return validators
+
+
+def file_hash(path):
+    with open(path, 'rb') as file:
+        return _digest(file.read())
+
+
+def generator_hash():
+    """Hash of the generator's own scripts, so a code change forces a render"""
+    digest = hashlib.sha256()
+    for path in sorted(glob.glob(os.path.join(SCRIPT_DIR, '*.py'))):
+        digest.update(os.path.basename(path).encode('utf-8'))
+        with open(path, 'rb') as file:
+            digest.update(file.read())
+    return digest.hexdigest()
+
+
+def output_settings(environ=os.environ):
+    return {name: value for name, value in environ.items() if name.startswith(OUTPUT_SETTING_PREFIXES)}
+
+
+def compute_fingerprint(session, username, template_path, clock_dependent=False):
+    """Digest of everything the render reads; clock_dependent adds today's UTC date"""
+    user = check_response(session.get(api_url(f"users/{username}"))).json()
+    parts = {
+        'user': user.get('updated_at'),
+        # Every page, since a star on any repo changes STAR_COUNT
+        'repos': _page_validators(session, api_url(f"users/{username}/repos"), {'per_page': REPOS_PER_PAGE}),
+        # Newest first, so any new event changes the first page
+        'events': _page_validators(session, api_url(f"users/{username}/events"), {'per_page': EVENTS_PER_PAGE},
+                                   max_pages=1),
+        'template': file_hash(template_path),
+        'generator': generator_hash(),
+        'settings': output_settings(),
+        # Dates, account age and sliding activity windows move every day
+        'date': datetime.datetime.now(datetime.timezone.utc).date().isoformat() if clock_dependent else None,
+    }
+    return _digest(json.dumps(parts, sort_keys=True).encode('utf-8'))
+
+
+class FingerprintStore:
+    """Fingerprint of the last complete render per (username, output)"""
+
+    def __init__(self, path=DEFAULT_FINGERPRINT_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+
+        try:
+            with open(path, 'r') as file:
+                self.fingerprints = json.load(file)
+        except (OSError, ValueError):
+            self.fingerprints = {}
+
+    @staticmethod
+    def key_for(username, output_path):
+        return f"{username}:{output_path}"
+
+    def unchanged(self, username, output_path, fingerprint):
+        # A missing output is never up to date
+        if not os.path.exists(output_path):
+            return False
+        with self.lock:
+            return self.fingerprints.get(self.key_for(username, output_path)) == fingerprint
+
+    def record(self, username, output_path, fingerprint):
+        with self.lock:
+            self.fingerprints[self.key_for(username, output_path)] = fingerprint
+
+    def save(self):
+        with self.lock:
+            atomic_write_json(self.path, self.fingerprints)
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Rate-limit-aware scheduling for every GitHub request of a run
+Tracks the core, search and GraphQL budgets separately, hands out request
+slots by section priority and backs off with jitter on 403/429 responses
+"""
+
+import os
+import time
+import heapq
+import random
+import itertools
+import threading
+import contextlib
+import contextvars
+import requests
+
+import deadline
+
+# Section priorities: lower runs first when requests have to queue
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+current_priority = contextvars.ContextVar('current_priority', default=PRIORITY_NORMAL)
+
+# Low-priority sections are deferred once a budget drops below this share
+LOW_BUDGET_FRACTION = float(os.environ.get("README_LOW_BUDGET_FRACTION", "0.1"))
+MAX_RETRIES = int(os.environ.get("README_MAX_RETRIES", "5"))
+# Never sleep longer than this for a single retry; give up instead
+MAX_WAIT_SECONDS = float(os.environ.get("README_MAX_RATE_LIMIT_WAIT", "900"))
+
+RETRYABLE_STATUSES = {429, 502, 503, 504}
+
+
+def resource_for(url):
+    if '/search/' in url:
+        return 'search'
+    if url.rstrip('/').endswith('/graphql'):
+        return 'graphql'
+    return 'core'
+
+
+@contextlib.contextmanager
+def section_priority(priority):
+    token = current_priority.set(priority)
+    try:
+        yield
+    finally:
+        current_priority.reset(token)
+
+
+class Budget:
+    def __init__(self):
+        self.limit = None
+        self.remaining = None
+        self.reset = 0.0
+        self.in_flight = 0
+        self.used = 0
+        self.waiting = []
+
+    def has_capacity(self, now):
+        if self.remaining is None or now >= self.reset:
+            return True
+        return self.remaining - self.in_flight > 0
+
+
+class RateLimitScheduler:
+    def __init__(self, max_retries=MAX_RETRIES, max_wait=MAX_WAIT_SECONDS):
+        self.max_retries = max_retries
+        self.max_wait = max_wait
+        self.budgets = {name: Budget() for name in ('core', 'search', 'graphql')}
+        self.cond = threading.Condition()
+        self.sequence = itertools.count()
+
+    def acquire(self, resource):
+        """Block until this request may go out, serving higher priorities first"""
+        budget = self.budgets[resource]
+        with self.cond:
+            ticket = (current_priority.get(), next(self.sequence))
+            heapq.heappush(budget.waiting, ticket)
+            while True:
+                now = time.time()
+                if budget.waiting[0] == ticket and budget.has_capacity(now):
+                    heapq.heappop(budget.waiting)
+                    budget.in_flight += 1
+                    self.cond.notify_all()
+                    return
+
+                # Don't queue past the deadline for a budget that won't reset in time
+                left = deadline.remaining()
+                if left is not None and left <= 0:
+                    budget.waiting.remove(ticket)
+                    heapq.heapify(budget.waiting)
+                    self.cond.notify_all()
+                    raise deadline.DeadlineExceeded(f"Deadline passed waiting for the {resource} rate limit")
+
+                timeout = max(budget.reset - now, 0.05) if not budget.has_capacity(now) else None
+                if left is not None:
+                    timeout = left if timeout is None else min(timeout, left)
+                self.cond.wait(timeout)
+
+    def release(self, resource, response):
+        with self.cond:
+            self.budgets[resource].in_flight -= 1
+            if response is not None:
+                self._update(response)
+            self.cond.notify_all()
+
+    def _update(self, response):
+        # The response names the bucket it was charged to
+        headers = response.headers
+        budget = self.budgets.get(headers.get('X-RateLimit-Resource', ''), None)
+        if budget is None or 'X-RateLimit-Remaining' not in headers:
+            return
+        budget.remaining = int(headers['X-RateLimit-Remaining'])
+        budget.limit = int(headers.get('X-RateLimit-Limit', budget.limit or 0)) or budget.limit
+        budget.reset = float(headers.get('X-RateLimit-Reset', budget.reset))
+        if 'X-RateLimit-Used' in headers:
+            budget.used = int(headers['X-RateLimit-Used'])
+
+    def budget_low(self, resource='core'):
+        budget = self.budgets[resource]
+        with self.cond:
+            if budget.remaining is None or budget.limit is None or time.time() >= budget.reset:
+                return False
+            return budget.remaining < budget.limit * LOW_BUDGET_FRACTION
+
+    def should_defer(self, priority=None, resource='core'):
+        priority = current_priority.get() if priority is None else priority
+        return priority >= PRIORITY_LOW and self.budget_low(resource)
+
+    def retry_delay(self, response, attempt):
+        """Seconds to wait before retrying, or None if the response should stand"""
+        if attempt >= self.max_retries:
+            return None
+
+        status = response.status_code
+        rate_limited = status == 429 or (status == 403 and (
+            response.headers.get('X-RateLimit-Remaining') == '0'
+            or 'Retry-After' in response.headers
+            or 'rate limit' in response.text.lower()))
+        if not rate_limited and status not in RETRYABLE_STATUSES:
+            return None
+
+        if 'Retry-After' in response.headers:
+            delay = float(response.headers['Retry-After'])
+        elif response.headers.get('X-RateLimit-Remaining') == '0':
+            delay = float(response.headers.get('X-RateLimit-Reset', time.time())) - time.time()
+        else:
+            # Exponential backoff for secondary limits and transient errors
+            delay = 2 ** attempt
+
+        delay = max(delay, 0) + random.uniform(0, 1)
+        if delay > self.max_wait:
+            return None
+        return delay
+
+    def summary(self):
+        with self.cond:
+            return {name: {'remaining': budget.remaining, 'limit': budget.limit}
+                    for name, budget in self.budgets.items()}
+
+
+class ScheduledSession(requests.Session):
+    """requests.Session whose requests are admitted and retried by a RateLimitScheduler"""
+
+    def __init__(self, scheduler=None, **kwargs):
+        super().__init__(**kwargs)
+        self.scheduler = scheduler
+
+    def retried(self, response):
+        """Called with each response that is dropped in favour of a retry"""
+
+    def send(self, request, **kwargs):
+        if self.scheduler is None:
+            return super().send(request, **kwargs)
+
+        resource = resource_for(request.url)
+        attempt = 0
+        while True:
+            self.scheduler.acquire(resource)
+            response = None
+            try:
+                response = super().send(request, **kwargs)
+            finally:
+                self.scheduler.release(resource, response)
+
+            delay = self.scheduler.retry_delay(response, attempt)
+            left = deadline.remaining()
+            if delay is None or (left is not None and delay >= left):
+                return response
+            print(f"GitHub {resource} request got {response.status_code}, retrying in {delay:.1f}s")
+            self.retried(response)
+            time.sleep(delay)
+            attempt += 1
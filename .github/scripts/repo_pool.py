@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Bounded thread-pool fan-out for the per-repository analysis passes
+Each pass does one or more blocking GitHub round trips per repo, so the work
+is latency-bound and overlaps well in threads
+"""
+
+import os
+import contextlib
+import contextvars
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+# README_MAX_WORKERS=1 restores the old strictly sequential behaviour
+DEFAULT_MAX_WORKERS = int(os.environ.get("README_MAX_WORKERS", "8"))
+
+# Per-repo failures of the section or resource being computed; the list is
+# shared with the worker threads through their copied contexts
+current_failures = contextvars.ContextVar('current_failures', default=None)
+
+
+class RepoAnalysisFailed(Exception):
+    pass
+
+
+@contextlib.contextmanager
+def collect_failures():
+    """Collect the per-repo failures reported inside the block into a list"""
+    failures = []
+    token = current_failures.set(failures)
+    try:
+        yield failures
+    finally:
+        current_failures.reset(token)
+
+
+def report_failure(description):
+    failures = current_failures.get()
+    if failures is not None:
+        failures.append(description)
+
+
+def map_repos(func, repos, max_workers=None):
+    """Run func over every repo and return the results in input order"""
+    repos = list(repos)
+    max_workers = max_workers or DEFAULT_MAX_WORKERS
+
+    if max_workers <= 1 or len(repos) <= 1:
+        return [func(repo) for repo in repos]
+
+    # Carry the caller's context (e.g. section priority) into the workers
+    contexts = [contextvars.copy_context() for _ in repos]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(repos))) as executor:
+        return list(executor.map(lambda context, repo: context.run(func, repo), contexts, repos))
+
+
+def sum_counters(counters):
+    # Merge in input order so most_common() breaks ties the same way every run
+    total = Counter()
+    for counter in counters:
+        total.update(counter)
+    return total
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Persisted per-repository analysis snapshot for incremental runs
+Results are keyed by repo id and only recomputed when pushed_at changes, so
+a daily run only pays for the repos that were actually pushed to
+"""
+
+import os
+import json
+import time
+import threading
+
+from json_file import atomic_write_json
+from repo_pool import report_failure
+
+DEFAULT_SNAPSHOT_PATH = os.environ.get("README_SNAPSHOT_PATH", ".cache/repo-snapshot.json")
+
+# README_INCREMENTAL=0 forces every repo to be re-analyzed; results are
+# still shared in memory for the rest of the process
+INCREMENTAL = os.environ.get("README_INCREMENTAL", "1") != "0"
+
+# Repos that disappear (deleted, renamed, made private) age out of the file
+STALE_AFTER_SECONDS = 30 * 24 * 3600
+
+
+def _field(repo, name):
+    # Works for both PyGithub objects and raw REST dicts
+    if isinstance(repo, dict):
+        return repo.get(name)
+    return getattr(repo, name)
+
+
+def repo_version(repo):
+    pushed_at = _field(repo, 'pushed_at')
+    if pushed_at is not None and not isinstance(pushed_at, str):
+        pushed_at = pushed_at.strftime('%Y-%m-%dT%H:%M:%SZ')
+    return f"{pushed_at}@{_field(repo, 'default_branch')}"
+
+
+class RepoSnapshot:
+    def __init__(self, path=DEFAULT_SNAPSHOT_PATH, enabled=INCREMENTAL):
+        self.path = path
+        self.enabled = enabled
+        self.lock = threading.Lock()
+        self.reused = 0
+        self.analyzed = 0
+
+        self.repos = {}
+        if enabled:
+            try:
+                with open(path, 'r') as file:
+                    self.repos = json.load(file)
+            except (OSError, ValueError):
+                pass
+
+    def _entry(self, repo):
+        # Caller must hold the lock
+        repo_id = str(_field(repo, 'id'))
+        version = repo_version(repo)
+        entry = self.repos.get(repo_id)
+        if entry is None or entry['version'] != version:
+            entry = {'name': _field(repo, 'name'), 'version': version, 'results': {}}
+            self.repos[repo_id] = entry
+        entry['seen'] = time.time()
+        return entry
+
+    def memoize(self, name, func, decode=lambda value: value, default=lambda: None, cached_only=False):
+        """Wrap a per-repo analyzer so unchanged repos are served from the snapshot
+
+        Failures return default() without being stored, so the repo is retried
+        on the next run, and are reported to the enclosing collect_failures()
+        so the caller doesn't mistake the partial totals for real ones. With
+        cached_only, repos missing from the snapshot get default() instead of
+        an API call.
+        """
+        def analyze(repo):
+            with self.lock:
+                results = self._entry(repo)['results']
+                if name in results:
+                    self.reused += 1
+                    return decode(results[name])
+
+            if cached_only:
+                return default()
+
+            try:
+                value = func(repo)
+            except Exception as e:
+                print(f"Error running {name} analysis for {_field(repo, 'name')}: {e}")
+                report_failure(f"{name} analysis for {_field(repo, 'name')}: {e}")
+                return default()
+
+            with self.lock:
+                self.analyzed += 1
+                self._entry(repo)['results'][name] = value
+            return value
+
+        return analyze
+
+    def save(self):
+        if not self.enabled:
+            return
+        with self.lock:
+            cutoff = time.time() - STALE_AFTER_SECONDS
+            self.repos = {repo_id: entry for repo_id, entry in self.repos.items()
+                          if entry.get('seen', 0) >= cutoff}
+            atomic_write_json(self.path, self.repos)
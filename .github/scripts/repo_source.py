@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Streaming source of the user's repositories
+Pages are fetched lazily and every repo is projected into a small __slots__
+record holding only the fields the sections read, so the full REST payloads
+never stay alive and every section shares one listing
+"""
+
+import datetime
+import threading
+
+from github_api import api_url, get_paginated
+
+REPOS_PER_PAGE = 100
+
+
+def _parse_date(value):
+    if value is None:
+        return None
+    return datetime.datetime.strptime(value, '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=datetime.timezone.utc)
+
+
+class RepoRecord:
+    # Attribute names follow the REST payload so records drop in where
+    # PyGithub repository objects were used
+    __slots__ = ('id', 'name', 'full_name', 'fork', 'language', 'stargazers_count',
+                 'created_at', 'pushed_at', 'default_branch')
+
+    def __init__(self, id, name, full_name, fork, language, stargazers_count, created_at, pushed_at, default_branch):
+        self.id = id
+        self.name = name
+        self.full_name = full_name
+        self.fork = fork
+        self.language = language
+        self.stargazers_count = stargazers_count
+        self.created_at = created_at
+        self.pushed_at = pushed_at
+        self.default_branch = default_branch
+
+    @classmethod
+    def from_json(cls, repo):
+        return cls(
+            repo['id'],
+            repo['name'],
+            repo['full_name'],
+            repo.get('fork', False),
+            repo.get('language'),
+            repo.get('stargazers_count', 0),
+            _parse_date(repo.get('created_at')),
+            _parse_date(repo.get('pushed_at')),
+            repo.get('default_branch'),
+        )
+
+    def __repr__(self):
+        return f"RepoRecord({self.full_name!r})"
+
+
+def iter_repos(session, username):
+    """Yield a RepoRecord per owned repo, one page at a time"""
+    url = api_url(f'users/{username}/repos')
+    for repo in get_paginated(session, url, params={'per_page': REPOS_PER_PAGE}):
+        yield RepoRecord.from_json(repo)
+
+
+class RepoSource:
+    """One lazily streamed repo listing shared by every section
+
+    Iterating replays the records already fetched and then pulls further
+    pages on demand, so the listing is downloaded at most once per run.
+    """
+
+    def __init__(self, session, username):
+        self.records = []
+        self.lock = threading.Lock()
+        self._pages = iter_repos(session, username)
+        self._exhausted = False
+        # A failed page fails every reader, not just the first one; the rest
+        # would otherwise see a silently truncated listing
+        self._error = None
+
+    def _fetch(self, index):
+        # Caller must hold the lock; fetch until records[index] exists
+        while not self._exhausted and index >= len(self.records):
+            try:
+                self.records.append(next(self._pages))
+            except StopIteration:
+                self._exhausted = True
+            except Exception as e:
+                self._error = e
+                self._exhausted = True
+        if index >= len(self.records) and self._error is not None:
+            raise self._error
+        return index < len(self.records)
+
+    def __iter__(self):
+        index = 0
+        while True:
+            with self.lock:
+                if not self._fetch(index):
+                    return
+                record = self.records[index]
+            yield record
+            index += 1
+
+    def __len__(self):
+        with self.lock:
+            while self._fetch(len(self.records)):
+                pass
+            return len(self.records)
+
+    @property
+    def complete(self):
+        """True once the whole listing was fetched without errors"""
+        with self.lock:
+            return self._exhausted and self._error is None
+
+    def own(self):
+        """Repos that aren't forks"""
+        return (repo for repo in self if not repo.fork)
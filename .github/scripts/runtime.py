@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Process-wide session, clients and caches for the README generator
+Each is created (and its module imported) on first use, so importing the
+generator has no side effects and a run only opens what its sections need
+"""
+
+import threading
+
+
+def _lazy(factory):
+    """Property that builds its value once, on first access"""
+    name = factory.__name__
+
+    def get(self):
+        with self.lock:
+            if name not in self.created:
+                self.created[name] = factory(self)
+            return self.created[name]
+
+    return property(get, doc=factory.__doc__)
+
+
+class Runtime:
+    # Saved at the end of a run, if they were used
+    PERSISTED = ('http_cache', 'snapshot', 'manifest_cache', 'last_good', 'figlets', 'fingerprints')
+
+    def __init__(self, token=None):
+        self.token = token
+        # Reentrant: the session is built from the cache and scheduler
+        self.lock = threading.RLock()
+        self.created = {}
+        self.metrics = None
+
+    def used(self, name):
+        with self.lock:
+            return name in self.created
+
+    def set_metrics(self, metrics):
+        """Charge the session's requests to metrics from now on"""
+        with self.lock:
+            self.metrics = metrics
+            if 'session' in self.created:
+                self.created['session'].metrics = metrics
+
+    @_lazy
+    def http_cache(self):
+        from http_cache import HTTPCache
+        return HTTPCache()
+
+    @_lazy
+    def scheduler(self):
+        from rate_limit import RateLimitScheduler
+        return RateLimitScheduler()
+
+    @_lazy
+    def session(self):
+        """One pooled, conditionally-cached, rate-limit-scheduled session shared by raw calls and PyGithub"""
+        from github_api import create_session
+        return create_session(self.token, cache=self.http_cache, scheduler=self.scheduler, metrics=self.metrics)
+
+    @_lazy
+    def github(self):
+        from github_api import create_github_client
+        return create_github_client(self.token, self.session)
+
+    @_lazy
+    def snapshot(self):
+        """Per-repo results from earlier runs; only pushed repos get re-analyzed"""
+        from repo_snapshot import RepoSnapshot
+        return RepoSnapshot()
+
+    @_lazy
+    def manifest_cache(self):
+        """Parsed package.json / Python manifests keyed by blob SHA"""
+        from stack_detect import ManifestCache
+        return ManifestCache()
+
+    @_lazy
+    def last_good(self):
+        """Served for sections that fail or run out of time, instead of zeros"""
+        from last_good import LastGoodValues
+        return LastGoodValues()
+
+    @_lazy
+    def history(self):
+        """Everything fetched is appended here, so trends need no extra API calls"""
+        from history import HistoryStore
+        return HistoryStore()
+
+    @_lazy
+    def figlets(self):
+        from figlet_cache import FigletCache
+        return FigletCache()
+
+    @_lazy
+    def fingerprints(self):
+        """Fingerprint of each profile's last complete render"""
+        from preflight import FingerprintStore
+        return FingerprintStore()
+
+    def save(self):
+        for name in self.PERSISTED:
+            if self.used(name):
+                getattr(self, name).save()
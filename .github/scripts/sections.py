@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Lazy section registry for the README generator
+Sections are registered as providers keyed by the placeholders they fill and
+only run, together with the resources they depend on, when the template
+actually references one of their placeholders
+"""
+
+import os
+import threading
+import contextvars
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from deadline import SECTION_BUDGET_SECONDS, DeadlineExceeded, deadline, expired
+from repo_pool import RepoAnalysisFailed, collect_failures
+
+# Independent sections run side by side; README_SECTION_WORKERS=1 runs them
+# one after another in dependency order
+DEFAULT_SECTION_WORKERS = int(os.environ.get("README_SECTION_WORKERS", "6"))
+
+class Node:
+    def __init__(self, name, func, requires=(), lazy=(), provides=(), budget=None):
+        self.name = name
+        self.func = func
+        self.requires = tuple(requires)
+        # Lazy dependencies are passed as zero-argument callables and only
+        # resolved if the section actually needs them on this run
+        self.lazy = tuple(lazy)
+        self.provides = tuple(provides)
+        # Seconds this node may take; None uses the default section budget
+        self.budget = budget
+
+
+class SectionRegistry:
+    def __init__(self):
+        self.nodes = {}
+        self.providers = {}
+
+    def resource(self, name=None, requires=(), lazy=(), budget=None):
+        """Register a shared value (events, repo list, ...) computed at most once per run"""
+        def register(func):
+            node_name = name or func.__name__
+            self.nodes[node_name] = Node(node_name, func, requires, lazy, budget=budget)
+            return func
+        return register
+
+    def section(self, *keys, requires=(), lazy=(), budget=None):
+        """Register a section that fills the given placeholders and returns {key: value}"""
+        def register(func):
+            node = Node(func.__name__, func, requires, lazy, provides=keys, budget=budget)
+            self.nodes[node.name] = node
+            for key in keys:
+                self.providers[key] = node.name
+            return func
+        return register
+
+    def dependents(self, names):
+        """The given nodes plus every node that depends on them, directly or not"""
+        affected = set(names)
+        changed = True
+        while changed:
+            changed = False
+            for node in self.nodes.values():
+                if node.name not in affected and affected.intersection(node.requires + node.lazy):
+                    affected.add(node.name)
+                    changed = True
+        return affected
+
+    def sections_for(self, keys):
+        return list(dict.fromkeys(self.providers[key] for key in keys if key in self.providers))
+
+    def plan(self, keys, seeds=()):
+        """Every node needed for the given placeholders, dependencies first"""
+        order = []
+        visiting = set()
+        done = set(seeds)
+
+        def visit(name):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Section dependency cycle through {name}")
+            if name not in self.nodes:
+                raise KeyError(f"Unknown section dependency: {name}")
+            visiting.add(name)
+            for dependency in self.nodes[name].requires:
+                visit(dependency)
+            visiting.discard(name)
+            done.add(name)
+            order.append(name)
+
+        for section_name in self.sections_for(keys):
+            visit(section_name)
+        return order
+
+
+class Evaluation:
+    """One run of the registry: memoized node values plus the collected data
+
+    With a fallback store, a section that fails, or whose budget runs out,
+    is served its last known good value and marked stale in the metrics.
+    """
+
+    def __init__(self, registry, seeds, metrics=None, fallback=None):
+        self.registry = registry
+        self.values = dict(seeds)
+        self.metrics = metrics
+        self.fallback = fallback
+        self.lock = threading.RLock()
+        # Nodes being computed right now, so concurrent callers wait for the
+        # one computation instead of starting their own
+        self.pending = {}
+        # Nodes that failed on this run; dependents see the same error
+        self.failures = {}
+        # Sections currently showing a fallback value, retried on the next run
+        self.stale = set()
+
+    def _call(self, node, kwargs):
+        budget = node.budget or SECTION_BUDGET_SECONDS
+        with deadline(budget), collect_failures() as failures:
+            if self.metrics is None:
+                value = node.func(**kwargs)
+            else:
+                with self.metrics.section(node.name):
+                    value = node.func(**kwargs)
+            # Per-repo passes swallow errors, so a node that ran out of time
+            # or lost some repos returns partial numbers; don't trust those
+            if node.provides and expired():
+                raise DeadlineExceeded(f"{node.name} ran out of time")
+        if failures:
+            more = f" and {len(failures) - 1} more" if len(failures) > 1 else ""
+            raise RepoAnalysisFailed(f"{failures[0]}{more}")
+        return value
+
+    def _fall_back(self, node, error):
+        if not node.provides or self.fallback is None:
+            return None
+        print(f"Section {node.name} failed ({error}), using its last known good value")
+        if self.metrics is not None:
+            self.metrics.mark_stale(node.name, str(error))
+        with self.lock:
+            self.stale.add(node.name)
+        return self.fallback.get(node.name, node.provides)
+
+    def resolve(self, name):
+        with self.lock:
+            if name in self.values:
+                return self.values[name]
+            if name in self.failures:
+                raise self.failures[name]
+            future = self.pending.get(name)
+            if future is None:
+                future = self.pending[name] = Future()
+                owner = True
+            else:
+                owner = False
+        if not owner:
+            return future.result()
+
+        try:
+            node = self.registry.nodes[name]
+            kwargs = {dependency: self.resolve(dependency) for dependency in node.requires}
+            for dependency in node.lazy:
+                kwargs[dependency] = lambda dependency=dependency: self.resolve(dependency)
+            value = self._call(node, kwargs)
+            if node.provides and self.fallback is not None:
+                self.fallback.put(name, value)
+        except Exception as e:
+            value = self._fall_back(node, e)
+            if value is None:
+                with self.lock:
+                    self.failures[name] = e
+                    del self.pending[name]
+                future.set_exception(e)
+                raise
+        except BaseException as e:
+            with self.lock:
+                del self.pending[name]
+            future.set_exception(e)
+            raise
+
+        with self.lock:
+            self.values[name] = value
+            del self.pending[name]
+        future.set_result(value)
+        return value
+
+    def invalidate(self, names):
+        """Forget the given nodes and everything computed from them"""
+        with self.lock:
+            for name in self.registry.dependents(names):
+                if name in self.registry.nodes:
+                    self.values.pop(name, None)
+                    self.failures.pop(name, None)
+
+    def patch(self, key, update):
+        """Replace one computed placeholder value with update(old)
+
+        Returns False, leaving the value alone, if it was not computed, is a
+        stale fallback (recomputed on the next run anyway) or update raises
+        ValueError on it.
+        """
+        with self.lock:
+            node_name = self.registry.providers.get(key)
+            value = self.values.get(node_name)
+            if value is None or key not in value or node_name in self.stale:
+                return False
+            try:
+                new_value = update(value[key])
+            except ValueError:
+                return False
+            self.values[node_name] = {**value, key: new_value}
+            # Anything derived from the patched section is recomputed
+            for name in self.registry.dependents([node_name]) - {node_name}:
+                self.values.pop(name, None)
+            return True
+
+    def run(self, keys, max_workers=None):
+        max_workers = max_workers or DEFAULT_SECTION_WORKERS
+        # A long-lived evaluation retries whatever failed or fell back last time
+        with self.lock:
+            retry = self.stale | set(self.failures)
+            self.stale = set()
+        if retry:
+            self.invalidate(retry)
+        order = self.registry.plan(keys, seeds=self.values)
+
+        if max_workers <= 1:
+            for name in order:
+                self._settle(lambda: self.resolve(name))
+        else:
+            self._run_concurrently(order, max_workers)
+
+        # Every requested section, not just the ones computed on this call:
+        # a re-render of a long-lived evaluation only recomputes what was
+        # invalidated and reuses (possibly patched) values for the rest
+        data = {}
+        for name in self.registry.sections_for(keys):
+            if name in self.values:
+                data.update(self.values[name])
+        return data
+
+    def _settle(self, wait_for):
+        # With a fallback store a failed resource only makes its dependents
+        # fall back; without one the first failure aborts the run
+        try:
+            wait_for()
+        except Exception:
+            if self.fallback is None:
+                raise
+
+    def _run_concurrently(self, order, max_workers):
+        # A node is submitted as soon as everything it requires is computed,
+        # so the run takes about as long as its slowest dependency chain
+        planned = set(order)
+        waiting = {name: {dependency for dependency in self.registry.nodes[name].requires if dependency in planned}
+                   for name in order}
+        running = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while waiting or running:
+                for name in [name for name, dependencies in waiting.items() if not dependencies]:
+                    del waiting[name]
+                    # Carry the caller's context (e.g. priority) into the worker
+                    context = contextvars.copy_context()
+                    running[executor.submit(context.run, self.resolve, name)] = name
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    self._settle(future.result)
+                    for dependencies in waiting.values():
+                        dependencies.discard(name)
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Framework and tool detection from one recursive git tree listing per repo
+Every file path in the repo is matched against the detection patterns in
+memory; manifests (package.json, requirements.txt, ...) are only downloaded
+when present and are cached by blob SHA, so unchanged ones are never fetched
+or parsed twice
+"""
+
+import os
+import json
+import time
+import base64
+import threading
+from collections import Counter
+
+from github_api import api_url, check_response, get_json
+from json_file import atomic_write_json
+
+DEFAULT_MANIFEST_CACHE_PATH = os.environ.get("README_MANIFEST_CACHE_PATH", ".cache/manifests.json")
+
+# Blobs not seen for this long are dropped from the manifest cache
+STALE_AFTER_SECONDS = 30 * 24 * 3600
+
+# Evidence weights: a declared dependency beats a matching file name
+PATH_WEIGHT = 3
+DEPENDENCY_WEIGHT = 5
+TOOL_DEPENDENCY_WEIGHT = 3
+
+# Vendored code says nothing about the repo's own stack
+IGNORED_DIRECTORIES = ('node_modules/', 'vendor/', 'site-packages/', '.venv/', 'venv/')
+
+PACKAGE_JSON_FRAMEWORKS = {
+    'react': 'React',
+    'next': 'Next.js',
+    'vue': 'Vue.js',
+    '@angular/core': 'Angular',
+    'svelte': 'Svelte',
+    'express': 'Express',
+}
+PACKAGE_JSON_TOOLS = {
+    'jest': 'Jest',
+    'webpack': 'Webpack',
+    'vite': 'Vite',
+}
+PYTHON_MANIFESTS = {'requirements.txt', 'pyproject.toml', 'pipfile'}
+
+
+def _is_ignored(path):
+    return any(path.startswith(directory) or f'/{directory}' in path for directory in IGNORED_DIRECTORIES)
+
+
+def parse_package_json(text):
+    try:
+        package_data = json.loads(text)
+    except json.JSONDecodeError:
+        return [], []
+    if not isinstance(package_data, dict):
+        return [], []
+    dependencies = {**(package_data.get('dependencies') or {}), **(package_data.get('devDependencies') or {})}
+    frameworks = [name for dependency, name in PACKAGE_JSON_FRAMEWORKS.items() if dependency in dependencies]
+    tools = [name for dependency, name in PACKAGE_JSON_TOOLS.items() if dependency in dependencies]
+    return frameworks, tools
+
+
+def parse_python_manifest(text):
+    content = text.lower()
+    frameworks = []
+    if 'django' in content:
+        frameworks.append('Django')
+    if 'flask' in content:
+        frameworks.append('Flask')
+    if 'tensorflow' in content or 'tf' in content:
+        frameworks.append('TensorFlow')
+    if 'torch' in content or 'pytorch' in content:
+        frameworks.append('PyTorch')
+    tools = ['Pytest'] if 'pytest' in content else []
+    return frameworks, tools
+
+
+class PathPatterns:
+    """Detection patterns matched against file paths by the kind of pattern
+
+    ".ts"                the file extension (".test.js" works too)
+    "/app.js"            a file or directory at the repository root
+    ".github/workflows"  consecutive whole path segments
+    "test_", "tf."       the start of a file name
+    anything else        a file called that (with or without extensions,
+                         e.g. "jest.config" matches jest.config.js) or a
+                         directory of that name anywhere in the tree
+    """
+
+    def __init__(self, patterns):
+        # patterns: (pattern, kind, name); dict lookups keep this linear in paths
+        self.extensions = {}
+        self.root = {}
+        self.segments = []
+        self.prefixes = []
+        self.names = {}
+        for pattern, kind, name in patterns:
+            pattern = pattern.lower()
+            if pattern.startswith('/'):
+                self.root.setdefault(pattern[1:], []).append((kind, name))
+            elif '/' in pattern:
+                self.segments.append((f"/{pattern}/", kind, name))
+            elif pattern.startswith('.'):
+                self.extensions.setdefault(pattern, []).append((kind, name))
+            elif pattern.endswith(('_', '.')):
+                self.prefixes.append((pattern, kind, name))
+            else:
+                self.names.setdefault(pattern, []).append((kind, name))
+
+    @staticmethod
+    def _file_names(basename):
+        # "jest.config.js" -> "jest", "jest.config", "jest.config.js"
+        dots = [i for i, char in enumerate(basename) if char == '.' and i > 0]
+        return [basename[:i] for i in dots] + [basename]
+
+    def match(self, path):
+        """(kind, name) pairs matched by one lowercased path"""
+        *directories, basename = path.split('/')
+        matches = []
+        for file_name in self._file_names(basename):
+            matches += self.names.get(file_name, [])
+        for directory in directories:
+            matches += self.names.get(directory, [])
+        for i, char in enumerate(basename):
+            if char == '.':
+                matches += self.extensions.get(basename[i:], [])
+        matches += self.root.get(directories[0] if directories else basename, [])
+        matches += [(kind, name) for prefix, kind, name in self.prefixes if basename.startswith(prefix)]
+        if self.segments:
+            wrapped = f"/{path}/"
+            matches += [(kind, name) for segment, kind, name in self.segments if segment in wrapped]
+        return matches
+
+
+def manifest_parser(path):
+    # Tree paths keep their case ("Pipfile"); the manifest names are lowercase
+    name = path.rsplit('/', 1)[-1].lower()
+    if name == 'package.json':
+        return parse_package_json
+    if name in PYTHON_MANIFESTS:
+        return parse_python_manifest
+    return None
+
+
+class ManifestCache:
+    """Parsed manifest results keyed by git blob SHA, persisted across runs"""
+
+    def __init__(self, path=DEFAULT_MANIFEST_CACHE_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.fetched = 0
+
+        try:
+            with open(path, 'r') as file:
+                self.blobs = json.load(file)
+        except (OSError, ValueError):
+            self.blobs = {}
+
+    def get(self, sha):
+        with self.lock:
+            entry = self.blobs.get(sha)
+            if entry is None:
+                return None
+            entry['seen'] = time.time()
+            self.hits += 1
+            return entry['frameworks'], entry['tools']
+
+    def put(self, sha, frameworks, tools):
+        with self.lock:
+            self.fetched += 1
+            self.blobs[sha] = {'frameworks': frameworks, 'tools': tools, 'seen': time.time()}
+
+    def save(self):
+        with self.lock:
+            cutoff = time.time() - STALE_AFTER_SECONDS
+            self.blobs = {sha: entry for sha, entry in self.blobs.items() if entry.get('seen', 0) >= cutoff}
+            atomic_write_json(self.path, self.blobs)
+
+
+class StackDetector:
+    def __init__(self, session, framework_patterns, tool_patterns, manifests=None):
+        self.session = session
+        self.manifests = manifests if manifests is not None else ManifestCache()
+        # Flatten to (pattern, kind, name) once; several names share patterns
+        patterns = [(pattern, 'frameworks', name)
+                    for name, patterns in framework_patterns.items() for pattern in patterns]
+        patterns += [(pattern, 'tools', name)
+                     for name, patterns in tool_patterns.items() for pattern in patterns]
+        self.patterns = PathPatterns(patterns)
+
+    def fetch_tree(self, full_name, ref):
+        """Every blob path of the repo as {path: sha}; empty for empty repos"""
+        url = api_url(f"repos/{full_name}/git/trees/{ref}")
+        response = self.session.get(url, params={'recursive': '1'})
+        # 409: empty repository, 404: branch without a tree
+        if response.status_code in (404, 409):
+            return {}
+        tree = check_response(response).json()
+        if tree.get('truncated'):
+            print(f"Tree listing for {full_name} is truncated, detection may be incomplete")
+        return {entry['path']: entry['sha'] for entry in tree.get('tree', []) if entry.get('type') == 'blob'}
+
+    def match_paths(self, paths):
+        # Dicts rather than sets keep first-match order, so ties rank the same on every run
+        found = {'frameworks': {}, 'tools': {}}
+        for path in paths:
+            for kind, name in self.patterns.match(path.lower()):
+                found[kind][name] = True
+        return found
+
+    def analyze_manifest(self, full_name, path, sha):
+        cached = self.manifests.get(sha)
+        if cached is not None:
+            return cached
+
+        blob = get_json(self.session, api_url(f"repos/{full_name}/git/blobs/{sha}"))
+        text = base64.b64decode(blob.get('content', '')).decode('utf-8', errors='replace')
+        frameworks, tools = manifest_parser(path)(text)
+        self.manifests.put(sha, frameworks, tools)
+        return frameworks, tools
+
+    def detect(self, full_name, ref):
+        """(frameworks Counter, tools Counter) for one repo"""
+        tree = self.fetch_tree(full_name, ref)
+        paths = [path for path in tree if not _is_ignored(path)]
+
+        frameworks_found = Counter()
+        tools_found = Counter()
+        matched = self.match_paths(paths)
+        for name in matched['frameworks']:
+            frameworks_found[name] += PATH_WEIGHT
+        for name in matched['tools']:
+            tools_found[name] += PATH_WEIGHT
+
+        # A dependency counts once per repo, however many manifests declare it
+        dependency_frameworks = {}
+        dependency_tools = {}
+        manifest_shas = {tree[path]: path for path in paths if manifest_parser(path)}
+        for sha, path in manifest_shas.items():
+            frameworks, tools = self.analyze_manifest(full_name, path, sha)
+            dependency_frameworks.update(dict.fromkeys(frameworks))
+            dependency_tools.update(dict.fromkeys(tools))
+        for name in dependency_frameworks:
+            frameworks_found[name] += DEPENDENCY_WEIGHT
+        for name in dependency_tools:
+            tools_found[name] += TOOL_DEPENDENCY_WEIGHT
+
+        return frameworks_found, tools_found
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Compiled single-pass template engine for the README
+The template is split once into literal and placeholder segments and then
+rendered with a single join, instead of one full-string replace per key
+"""
+
+import os
+import re
+import tempfile
+
+PLACEHOLDER_PATTERN = re.compile(r"\{\{ ([A-Z0-9_]+) \}\}")
+
+
+class Template:
+    def __init__(self, text):
+        # Even indexes are literal text, odd indexes are placeholder names
+        self.segments = PLACEHOLDER_PATTERN.split(text)
+        self.keys = list(dict.fromkeys(self.segments[1::2]))
+
+    @classmethod
+    def from_file(cls, path):
+        with open(path, 'r', encoding='utf-8') as file:
+            return cls(file.read())
+
+    def render(self, data):
+        parts = []
+        for i, segment in enumerate(self.segments):
+            if i % 2 == 0:
+                parts.append(segment)
+            elif segment in data:
+                parts.append(str(data[segment]))
+            else:
+                # Leave unknown placeholders untouched, as the old replace loop did
+                parts.append(f"{{{{ {segment} }}}}")
+        return "".join(parts)
+
+
+def write_if_changed(path, text):
+    """Atomically replace path with text; returns False if it was already identical"""
+    content = text.encode('utf-8')
+    try:
+        with open(path, 'rb') as file:
+            if file.read() == content:
+                return False
+    except FileNotFoundError:
+        pass
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.readme-', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(content)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return True
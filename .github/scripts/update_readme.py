@@ -8,26 +8,112 @@ import os
 import re
 import json
 import random
+import argparse
 import datetime
-import requests
-from github import Github
-from dateutil.relativedelta import relativedelta
-import cowsay
-import pyfiglet
 from collections import Counter
 import base64
 
+# Only what every run needs is imported here. requests, PyGithub, pyfiglet
+# and the API helpers are imported by the sections that use them, so a
+# template without API placeholders never loads them
+from metrics import DEFAULT_METRICS_PATH, Metrics, write_report
+from repo_pool import map_repos, sum_counters
+from keyword_match import KeywordMatcher
+from language_stats import LanguageStats
+from runtime import Runtime
+from sections import Evaluation, SectionRegistry
+from template import Template, write_if_changed
+from deadline import RUN_DEADLINE_SECONDS, deadline
+from last_good import MISSING_VALUE
+
 # GitHub Authentication
 github_token = os.environ.get("GH_TOKEN")
 github_username = os.environ.get("GITHUB_USERNAME", "centopw")
-g = Github(github_token)
-user = g.get_user(github_username)
 
-# Initialize data dictionary
-data = {}
+# The template keeps its placeholders; the rendered output is written separately
+template_path = os.environ.get("README_TEMPLATE", ".github/README.template.md")
+output_path = os.environ.get("README_OUTPUT", "README.md")
+
+# Session, PyGithub client, response cache, repo snapshot and the other
+# caches, shared by every profile; each is created on first use
+state = Runtime(github_token)
+
+# Window for the *_GAINED trend placeholders and for ACTIVE_DAYS
+TREND_DAYS = int(os.environ.get("README_TREND_DAYS", "30"))
+UPTIME_DAYS = int(os.environ.get("README_UPTIME_DAYS", "365"))
+
+# README_FORCE_REFRESH=1 (or --force) renders even when the pre-flight
+# fingerprint says nothing changed
+FORCE_REFRESH = os.environ.get("README_FORCE_REFRESH", "0") == "1"
+
+# Nodes whose output changes with the date alone; a template using any of
+# them is re-rendered at least once a day even if GitHub data is unchanged
+CLOCK_DEPENDENT = ("current_date_section", "days_active_section", "activity", "active_days_section",
+                   "stars_gained_section", "commits_gained_section")
+
+# Sections about the account as a commit, PR or issue author, or built from
+# its own events. An organization is never one, so for an org profile these
+# render as N/A and only the repo-scoped and static sections are computed
+AUTHOR_SCOPED = ("activity_graph_section", "activity_graph_year_section", "commit_count_section",
+                 "commits_gained_section", "active_days_section", "pr_count_section", "issue_count_section",
+                 "contrib_section", "top_projects_section", "learning_section")
+
+# Optional GraphQL backend fills the stats sections in a few batched queries
+stats_backend = os.environ.get("README_BACKEND", "rest")
+
+# Every section is a lazy provider keyed by the placeholders it fills; only
+# the ones the template references (plus their dependencies) are executed
+sections = SectionRegistry()
+
+@sections.resource("session")
+def load_session():
+    return state.session
+
+@sections.resource("github", requires=("session",))
+def load_github(session):
+    return state.github
+
+@sections.resource("user", requires=("github", "username"))
+def load_user(github, username):
+    # Lazy object: nothing is fetched until a section reads an attribute
+    return github.get_user(username, lazy=True)
+
+@sections.resource("events", requires=("session", "username"))
+def load_events(session, username):
+    from event_store import EventStore
+    from rate_limit import PRIORITY_HIGH, section_priority
+
+    # One events download shared by every section
+    with section_priority(PRIORITY_HIGH):
+        events = EventStore.fetch(session, username)
+    # Kept beyond the ~90 days the API remembers
+    state.history.record_events(username, events.events)
+    return events
+
+@sections.resource("repo_list", requires=("session", "username"))
+def load_repo_list(session, username):
+    from repo_source import RepoSource
+
+    # Streamed page by page into compact records on first use
+    return RepoSource(session, username)
+
+@sections.resource("graphql_data", requires=("token", "session", "username"), lazy=("events",))
+def load_graphql_data(token, session, username, events):
+    # Anything this provides is skipped by the REST sections
+    if stats_backend != "graphql" or not token:
+        return {}
+    from graphql_backend import fetch_profile_stats, stats_to_data
+    try:
+        profile_stats = fetch_profile_stats(session, username)
+        return stats_to_data(profile_stats, events(), "tanhiep.dev")
+    except Exception as e:
+        print(f"GraphQL backend failed, falling back to REST: {e}")
+        return {}
 
 # Get current date
-data["CURRENT_DATE"] = datetime.datetime.now().strftime("%A, %B %d, %Y - %H:%M:%S UTC")
+@sections.section("CURRENT_DATE")
+def current_date_section():
+    return {"CURRENT_DATE": datetime.datetime.now().strftime("%A, %B %d, %Y - %H:%M:%S UTC")}
 
 # Random status messages
 status_messages = [
@@ -38,239 +124,181 @@ status_messages = [
     "Crafting digital experiences that matter",
     "Breaking and rebuilding things to understand them better"
 ]
-data["CURRENT_STATUS"] = random.choice(status_messages)
 
-# Calculate days active
-account_created = user.created_at
-days_active = (datetime.datetime.now().replace(tzinfo=None) - account_created.replace(tzinfo=None)).days
-data["DAYS_ACTIVE"] = days_active
+@sections.section("CURRENT_STATUS")
+def current_status_section():
+    return {"CURRENT_STATUS": random.choice(status_messages)}
 
-# Get repo information
-repos = user.get_repos()
-repo_list = list(repos)
+# Calculate days active
+@sections.section("DAYS_ACTIVE", requires=("graphql_data", "user"))
+def days_active_section(graphql_data, user):
+    if "DAYS_ACTIVE" in graphql_data:
+        return {"DAYS_ACTIVE": graphql_data["DAYS_ACTIVE"]}
+    account_created = user.created_at
+    days_active = (datetime.datetime.now().replace(tzinfo=None) - account_created.replace(tzinfo=None)).days
+    return {"DAYS_ACTIVE": days_active}
 
 # Count statistics
-data["REPO_COUNT"] = user.public_repos
-data["STAR_COUNT"] = sum(repo.stargazers_count for repo in repo_list)
-
-# Function to generate an ASCII activity graph based on actual commit data
-def generate_activity_graph(username, token, days=30):
-    headers = {
-        'Authorization': f'token {token}',
-        'Accept': 'application/vnd.github.v3+json'
+@sections.section("REPO_COUNT", "STAR_COUNT", requires=("graphql_data", "user"), lazy=("repo_list",))
+def repo_stats_section(graphql_data, user, repo_list):
+    if "REPO_COUNT" in graphql_data:
+        return {key: graphql_data[key] for key in ("REPO_COUNT", "STAR_COUNT")}
+    return {
+        "REPO_COUNT": user.public_repos,
+        "STAR_COUNT": sum(repo.stargazers_count for repo in repo_list()),
     }
-    
-    # Get user's events
-    url = f'https://api.github.com/users/{username}/events'
-    response = requests.get(url, headers=headers)
-    events = response.json()
-    
-    # Filter push events (commits)
-    push_events = [event for event in events if event['type'] == 'PushEvent']
-    
-    # Create a dict of dates and commit counts
-    today = datetime.datetime.now().date()
-    start_date = today - datetime.timedelta(days=days)
-    
-    # Initialize activity dictionary with zeros for all days
-    activity_dict = {(start_date + datetime.timedelta(days=i)).strftime('%Y-%m-%d'): 0 
-                     for i in range(days + 1)}
-    
-    # Count commits per day
-    for event in push_events:
-        date = datetime.datetime.strptime(event['created_at'], '%Y-%m-%dT%H:%M:%SZ').strftime('%Y-%m-%d')
-        if date in activity_dict:
-            # Count number of commits in this push
-            activity_dict[date] += len(event['payload'].get('commits', []))
-    
-    # Convert to a normalized activity level (0-7 for GitHub-style graph)
-    activity_values = list(activity_dict.values())
-    max_activity = max(activity_values) if max(activity_values) > 0 else 1
-    normalized_activity = [min(7, int((count / max_activity) * 7)) for count in activity_values]
-    
-    # Generate the ASCII graph
-    height = 7
-    width = len(normalized_activity)
-    graph = []
-    
-    # Create the graph from bottom to top
-    for h in range(height, 0, -1):
-        line = ""
-        for a in normalized_activity:
-            if a >= h:
-                line += "█"
-            else:
-                line += " "
-        graph.append(line)
-    
-    # Add bottom axis
-    axis = "─" * width
-    
-    # Add dates indicators (first and last date)
-    date_line = f"{list(activity_dict.keys())[0]}{''.center(width-20)}{list(activity_dict.keys())[-1]}"
-    
-    # Combine everything
-    result = "\n".join(graph) + "\n" + axis + "\n" + date_line
-    return result
 
-data["ACTIVITY_GRAPH"] = generate_activity_graph(github_username, github_token)
+# Day offset of the year graph's first day; with the last day included that
+# is 365 days, exactly one contribution calendar query
+YEAR_WINDOW_DAYS = 364
 
-# Count total commits across all repositories
-def count_user_commits(username, token):
-    headers = {
-        'Authorization': f'token {token}',
-        'Accept': 'application/vnd.github.v3+json'
-    }
-    
-    # Start with events API for recent commits
-    url = f'https://api.github.com/users/{username}/events'
-    response = requests.get(url, headers=headers)
-    events = response.json()
-    
-    # Count commits from events
-    commit_count = 0
-    for event in events:
-        if event['type'] == 'PushEvent':
-            commit_count += len(event['payload'].get('commits', []))
-    
-    # For older data, we need to go through repositories
-    # Get user's repositories
-    repos_url = f'https://api.github.com/users/{username}/repos?per_page=100'
-    response = requests.get(repos_url, headers=headers)
-    repos = response.json()
-    
-    # For each repo, get commit statistics
-    for repo in repos:
-        # Skip forks to avoid double counting
-        if repo.get('fork', False):
-            continue
-            
-        # Get commits for this repo
-        commits_url = f"https://api.github.com/repos/{username}/{repo['name']}/commits?author={username}&per_page=1"
-        commit_response = requests.get(commits_url, headers=headers)
-        
-        # Extract the commit count from Link header if available
-        if 'Link' in commit_response.headers:
-            link_header = commit_response.headers['Link']
-            if 'rel="last"' in link_header:
-                # Extract the page number from the Link header
-                match = re.search(r'page=(\d+)>; rel="last"', link_header)
-                if match:
-                    repo_commit_count = int(match.group(1))
-                    commit_count += repo_commit_count
-        else:
-            # If no Link header, count the commits in the response
-            repo_commits = commit_response.json()
-            if isinstance(repo_commits, list):
-                commit_count += len(repo_commits)
-    
-    return commit_count
+# Function to generate an ASCII activity graph based on actual commit data
+# One daily series covers every activity graph; a year of the contribution
+# calendar is a single GraphQL query
+@sections.resource("activity", requires=("session", "username", "token"), lazy=("events",))
+def load_activity(session, username, token, events):
+    from activity import ACTIVITY_DAYS, load_activity_series
+    return load_activity_series(session, username, max(ACTIVITY_DAYS, YEAR_WINDOW_DAYS), events, token=token,
+                                history=state.history)
+
+@sections.section("ACTIVITY_GRAPH", requires=("activity",))
+def activity_graph_section(activity):
+    from activity import ACTIVITY_DAYS, ACTIVITY_RESOLUTION, render_activity_graph
+    return {"ACTIVITY_GRAPH": render_activity_graph(activity.window(ACTIVITY_DAYS), ACTIVITY_RESOLUTION)}
+
+@sections.section("ACTIVITY_GRAPH_YEAR", requires=("activity",))
+def activity_graph_year_section(activity):
+    from activity import render_activity_graph
+    return {"ACTIVITY_GRAPH_YEAR": render_activity_graph(activity.window(YEAR_WINDOW_DAYS), "week")}
+
+# Count commits authored by the user in a single repository
+def count_repo_commits(username, session, full_name):
+    from github_api import api_url, check_response
+
+    # Org repos live under the owner, not the user
+    commits_url = api_url(f"repos/{full_name}/commits?author={username}&per_page=1")
+    commit_response = session.get(commits_url)
+    if commit_response.status_code == 409:  # Empty repository
+        return 0
+    check_response(commit_response)
+    
+    # Extract the commit count from Link header if available
+    if 'Link' in commit_response.headers:
+        link_header = commit_response.headers['Link']
+        if 'rel="last"' in link_header:
+            # Extract the page number from the Link header
+            match = re.search(r'page=(\d+)>; rel="last"', link_header)
+            if match:
+                return int(match.group(1))
+        return 0
+    
+    # If no Link header, count the commits in the response
+    repo_commits = commit_response.json()
+    if isinstance(repo_commits, list):
+        return len(repo_commits)
+    return 0
+
+# Commits authored by the user in each of their repositories
+@sections.resource("repo_commits", requires=("username", "session", "repo_list"))
+def load_repo_commits(username, session, repo_list):
+    # Skip forks to avoid double counting. Commit counts depend on the
+    # author, so they are stored per user
+    repos = list(repo_list.own())
+    analyze = state.snapshot.memoize(f'commits:{username}', lambda repo: count_repo_commits(username, session, repo.full_name),
+                               default=int)
+    return dict(zip((repo.full_name for repo in repos), map_repos(analyze, repos)))
 
-data["COMMIT_COUNT"] = str(count_user_commits(github_username, github_token))
+# Count total commits across all repositories
+def count_user_commits(events, repo_commits):
+    # Start with events API for recent commits, then add the per-repo
+    # counts for older data
+    return events.push_commit_count() + sum(repo_commits.values())
+
+@sections.section("COMMIT_COUNT", requires=("graphql_data",), lazy=("events", "repo_commits"))
+def commit_count_section(graphql_data, events, repo_commits):
+    if "COMMIT_COUNT" in graphql_data:
+        return {"COMMIT_COUNT": graphql_data["COMMIT_COUNT"]}
+    return {"COMMIT_COUNT": str(count_user_commits(events(), repo_commits()))}
+
+# Trends from the history store: growth since TREND_DAYS ago and days with
+# any activity in the last UPTIME_DAYS
+def format_delta(delta):
+    if delta is None:
+        return MISSING_VALUE
+    return f"+{delta}" if delta >= 0 else str(delta)
+
+@sections.section("STARS_GAINED", requires=("username", "repo_stats_section"))
+def stars_gained_section(username, repo_stats_section):
+    delta = state.history.delta(username, "STAR_COUNT", repo_stats_section["STAR_COUNT"], TREND_DAYS)
+    return {"STARS_GAINED": format_delta(delta)}
+
+@sections.section("COMMITS_GAINED", requires=("username", "commit_count_section"))
+def commits_gained_section(username, commit_count_section):
+    delta = state.history.delta(username, "COMMIT_COUNT", commit_count_section["COMMIT_COUNT"], TREND_DAYS)
+    return {"COMMITS_GAINED": format_delta(delta)}
+
+@sections.section("ACTIVE_DAYS", requires=("username", "events"))
+def active_days_section(username, events):
+    # Loading the events recorded them, so this also counts older runs
+    since = datetime.date.today() - datetime.timedelta(days=UPTIME_DAYS)
+    return {"ACTIVE_DAYS": str(state.history.active_days(username, since))}
 
 # Count pull requests
-def count_pull_requests(username, token):
-    headers = {
-        'Authorization': f'token {token}',
-        'Accept': 'application/vnd.github.v3+json'
-    }
-    
+def count_pull_requests(username, session):
+    from github_api import api_url, get_json
+
     # Search for PRs created by the user
-    search_url = f'https://api.github.com/search/issues?q=author:{username}+type:pr'
-    response = requests.get(search_url, headers=headers)
-    search_results = response.json()
+    search_url = api_url(f'search/issues?q=author:{username}+type:pr')
+    search_results = get_json(session, search_url)
     
     return search_results.get('total_count', 0)
 
-data["PR_COUNT"] = str(count_pull_requests(github_username, github_token))
+@sections.section("PR_COUNT", requires=("graphql_data", "username", "session"))
+def pr_count_section(graphql_data, username, session):
+    if "PR_COUNT" in graphql_data:
+        return {"PR_COUNT": graphql_data["PR_COUNT"]}
+    return {"PR_COUNT": str(count_pull_requests(username, session))}
 
 # Count issues
-def count_issues(username, token):
-    headers = {
-        'Authorization': f'token {token}',
-        'Accept': 'application/vnd.github.v3+json'
-    }
-    
+def count_issues(username, session):
+    from github_api import api_url, get_json
+
     # Search for issues created by the user
-    search_url = f'https://api.github.com/search/issues?q=author:{username}+type:issue'
-    response = requests.get(search_url, headers=headers)
-    search_results = response.json()
+    search_url = api_url(f'search/issues?q=author:{username}+type:issue')
+    search_results = get_json(session, search_url)
     
     return search_results.get('total_count', 0)
 
-data["ISSUE_COUNT"] = str(count_issues(github_username, github_token))
+@sections.section("ISSUE_COUNT", requires=("graphql_data", "username", "session"))
+def issue_count_section(graphql_data, username, session):
+    if "ISSUE_COUNT" in graphql_data:
+        return {"ISSUE_COUNT": graphql_data["ISSUE_COUNT"]}
+    return {"ISSUE_COUNT": str(count_issues(username, session))}
 
 # Count contributions to other repositories
-def count_contributions(username, token):
-    headers = {
-        'Authorization': f'token {token}',
-        'Accept': 'application/vnd.github.v3+json'
-    }
-    
-    # Get user's events
-    url = f'https://api.github.com/users/{username}/events'
-    response = requests.get(url, headers=headers)
-    events = response.json()
-    
+def count_contributions(username, events):
     # Find unique repositories that aren't owned by the user
-    contributed_repos = set()
-    for event in events:
-        repo_name = event['repo']['name']
-        if not repo_name.startswith(f"{username}/"):
-            contributed_repos.add(repo_name)
+    contributed_repos = {repo_name for repo_name in events.repo_names()
+                         if not repo_name.startswith(f"{username}/")}
     
     return len(contributed_repos)
 
-data["CONTRIB"] = str(count_contributions(github_username, github_token))
-
-# Get latest commit dates for projects
-def get_latest_commit_date(repo):
-    try:
-        latest_commits = list(repo.get_commits(sha=repo.default_branch))
-        if latest_commits:
-            return latest_commits[0].commit.author.date.strftime("%b %d")
-        return "N/A"
-    except Exception as e:
-        print(f"Error getting commits for {repo.name}: {e}")
-        return "N/A"
-
-try:
-    tanhiep_repo = g.get_repo(f"{github_username}/tanhiep.dev")
-    data["SITE_COMMIT"] = get_latest_commit_date(tanhiep_repo)
-except Exception as e:
-    print(f"Error accessing personal site repo: {e}")
-    data["SITE_COMMIT"] = "N/A"
+@sections.section("CONTRIB", requires=("username", "events"))
+def contrib_section(username, events):
+    return {"CONTRIB": str(count_contributions(username, events))}
 
 # Get current projects (based on recent activity)
-def get_recent_projects(username, token, count=3):
-    headers = {
-        'Authorization': f'token {token}',
-        'Accept': 'application/vnd.github.v3+json'
-    }
-    
-    # Get user's events
-    url = f'https://api.github.com/users/{username}/events'
-    response = requests.get(url, headers=headers)
-    events = response.json()
-    
-    # Extract repositories with recent commits
-    recent_repos = []
-    for event in events:
-        if event['type'] == 'PushEvent':
-            repo_name = event['repo']['name'].split('/')[1]  # Extract repo name without username
-            repo_date = datetime.datetime.strptime(event['created_at'], '%Y-%m-%dT%H:%M:%SZ')
-            
-            # Check if repo is already in the list
-            existing = next((r for r in recent_repos if r['name'] == repo_name), None)
-            if existing:
-                # Update date if this one is more recent
-                if repo_date > existing['date']:
-                    existing['date'] = repo_date
-            else:
-                recent_repos.append({
-                    'name': repo_name,
-                    'date': repo_date
-                })
+def get_recent_projects(events, count=3):
+    # Extract repositories with recent commits, keeping the latest push per repo
+    latest_push = {}
+    for event in events.of_type('PushEvent'):
+        full_name = event['repo']['name']
+        if full_name not in latest_push or event['created'] > latest_push[full_name]:
+            latest_push[full_name] = event['created']
+    
+    recent_repos = [{'name': full_name.split('/')[1],  # Repo name without username
+                     'full_name': full_name,
+                     'date': date} for full_name, date in latest_push.items()]
     
     # Sort by most recent activity
     recent_repos.sort(key=lambda x: x['date'], reverse=True)
@@ -278,279 +306,217 @@ def get_recent_projects(username, token, count=3):
     # Return the top repositories
     return recent_repos[:count]
 
-recent_projects = get_recent_projects(github_username, github_token)
-
-# Add project data to the data dictionary
-if recent_projects:
-    data["NEW_PROJECT"] = recent_projects[0]['name']
-    data["NEW_COMMIT"] = recent_projects[0]['date'].strftime("%b %d")
-    
-    # Add data for specific project types if available
-    ai_project = next((p for p in recent_projects if any(kw in p['name'].lower() for kw in 
-                       ['ai', 'ml', 'machine', 'learning', 'neural', 'deep'])), None)
-    if ai_project:
-        data["AI_COMMIT"] = ai_project['date'].strftime("%b %d")
+@sections.resource("recent_projects", requires=("events",))
+def load_recent_projects(events):
+    return get_recent_projects(events)
+
+@sections.section("SITE_COMMIT", "NEW_PROJECT", "NEW_COMMIT", "AI_COMMIT", "REACT_COMMIT",
+                  requires=("graphql_data", "username", "token", "session", "recent_projects"))
+def top_projects_section(graphql_data, username, token, session, recent_projects):
+    data = {}
+    
+    # Resolve the real head-commit date of every project in the "top" section in one batch
+    site_repo = f"{username}/tanhiep.dev"
+    top_repos = [project['full_name'] for project in recent_projects]
+    if "SITE_COMMIT" not in graphql_data:
+        top_repos.insert(0, site_repo)
+    from head_commits import latest_commit_dates
+    head_dates = latest_commit_dates(session, top_repos, use_graphql=bool(token))
+    
+    def commit_date(project):
+        # Fall back to the push time if the head commit couldn't be resolved
+        date = head_dates.get(project['full_name']) or project['date']
+        return date.strftime("%b %d")
+    
+    if "SITE_COMMIT" in graphql_data:
+        data["SITE_COMMIT"] = graphql_data["SITE_COMMIT"]
     else:
-        data["AI_COMMIT"] = "N/A"
+        site_date = head_dates.get(site_repo)
+        data["SITE_COMMIT"] = site_date.strftime("%b %d") if site_date else "N/A"
+    
+    # Add project data to the data dictionary
+    if recent_projects:
+        data["NEW_PROJECT"] = recent_projects[0]['name']
+        data["NEW_COMMIT"] = commit_date(recent_projects[0])
         
-    react_project = next((p for p in recent_projects if any(kw in p['name'].lower() for kw in 
-                          ['react', 'frontend', 'web', 'ui'])), None)
-    if react_project:
-        data["REACT_COMMIT"] = react_project['date'].strftime("%b %d")
+        # Add data for specific project types if available
+        ai_project = next((p for p in recent_projects if any(kw in p['name'].lower() for kw in 
+                           ['ai', 'ml', 'machine', 'learning', 'neural', 'deep'])), None)
+        if ai_project:
+            data["AI_COMMIT"] = commit_date(ai_project)
+        else:
+            data["AI_COMMIT"] = "N/A"
+            
+        react_project = next((p for p in recent_projects if any(kw in p['name'].lower() for kw in 
+                              ['react', 'frontend', 'web', 'ui'])), None)
+        if react_project:
+            data["REACT_COMMIT"] = commit_date(react_project)
+        else:
+            data["REACT_COMMIT"] = "N/A"
     else:
+        # Fallback if no recent projects found
+        data["NEW_PROJECT"] = "N/A"
+        data["NEW_COMMIT"] = "N/A"
+        data["AI_COMMIT"] = "N/A"
         data["REACT_COMMIT"] = "N/A"
-else:
-    # Fallback if no recent projects found
-    data["NEW_PROJECT"] = "N/A"
-    data["NEW_COMMIT"] = "N/A"
-    data["AI_COMMIT"] = "N/A"
-    data["REACT_COMMIT"] = "N/A"
+    
+    return data
 
 # Analyze repos for languages and tools
-def analyze_repo_languages(repos):
-    language_counter = Counter()
-    
-    for repo in repos:
-        # Skip forks to focus on original work
-        if repo.fork:
-            continue
-            
-        # Add repo language
-        if repo.language:
-            language_counter[repo.language] += 1
-        
-        # Try to get more detailed language breakdown
-        try:
-            languages = repo.get_languages()
-            for lang, bytes_count in languages.items():
-                language_counter[lang] += bytes_count
-        except Exception as e:
-            print(f"Error getting languages for {repo.name}: {e}")
-    
-    # Return most common languages
-    return language_counter.most_common(10)
-
-# Detect frameworks and tools from repository contents
-def detect_frameworks_and_tools(repos, token):
-    headers = {
-        'Authorization': f'token {token}',
-        'Accept': 'application/vnd.github.v3+json'
-    }
-    
-    # Framework and tool detection patterns
-    framework_patterns = {
-        'React': ['react', 'jsx', 'tsx'],
-        'Next.js': ['next.config.js', 'nextjs'],
-        'Vue.js': ['vue.js', 'vue.config.js', 'vuejs'],
-        'Angular': ['angular.json', 'ngx'],
-        'Django': ['django', 'wsgi.py', 'asgi.py'],
-        'Flask': ['flask', 'app.py', 'wsgi.py'],
-        'Express': ['express', 'app.js', 'server.js'],
-        'Spring Boot': ['spring-boot', 'application.properties'],
-        'Laravel': ['laravel', 'artisan'],
-        'Svelte': ['svelte.config.js'],
-        'Node.js': ['package.json', 'node_modules'],
-        'TensorFlow': ['tensorflow', 'tf.'],
-        'PyTorch': ['torch', 'pytorch']
-    }
-    
-    tool_patterns = {
-        'Docker': ['dockerfile', 'docker-compose'],
-        'Kubernetes': ['kubernetes', 'k8s', 'helm'],
-        'AWS': ['aws', 'amazon web services', 'cloudformation'],
-        'GCP': ['gcp', 'google cloud'],
-        'Firebase': ['firebase', 'firestore'],
-        'GitHub Actions': ['.github/workflows'],
-        'Jenkins': ['jenkinsfile'],
-        'Terraform': ['terraform', '.tf'],
-        'Jest': ['jest.config', 'test.js'],
-        'Pytest': ['pytest', 'test_'],
-        'Webpack': ['webpack.config'],
-        'Vite': ['vite.config'],
-        'Nginx': ['nginx.conf'],
-        'GraphQL': ['graphql', 'apollo'],
-        'TypeScript': ['tsconfig.json', '.ts', '.tsx'],
-        'CI/CD': ['.github/workflows', '.gitlab-ci.yml', 'jenkins']
-    }
-    
-    frameworks_found = Counter()
-    tools_found = Counter()
-    
-    for repo in repos:
-        # Skip forks
-        if repo.fork:
-            continue
-            
-        try:
-            # Check root directory for common config files
-            contents = repo.get_contents("")
-            file_list = [content.name.lower() for content in contents if content.type == "file"]
-            
-            # Check for package.json to detect frontend frameworks
-            package_json = next((content for content in contents if content.name == "package.json"), None)
-            if package_json:
-                content = repo.get_contents(package_json.path).decoded_content.decode('utf-8')
-                try:
-                    package_data = json.loads(content)
-                    dependencies = {**package_data.get('dependencies', {}), **package_data.get('devDependencies', {})}
-                    
-                    # Check dependencies for frameworks
-                    if 'react' in dependencies:
-                        frameworks_found['React'] += 5
-                    if 'next' in dependencies:
-                        frameworks_found['Next.js'] += 5
-                    if 'vue' in dependencies:
-                        frameworks_found['Vue.js'] += 5
-                    if '@angular/core' in dependencies:
-                        frameworks_found['Angular'] += 5
-                    if 'svelte' in dependencies:
-                        frameworks_found['Svelte'] += 5
-                    if 'express' in dependencies:
-                        frameworks_found['Express'] += 5
-                    
-                    # Check for testing frameworks
-                    if 'jest' in dependencies:
-                        tools_found['Jest'] += 3
-                    if 'webpack' in dependencies:
-                        tools_found['Webpack'] += 3
-                    if 'vite' in dependencies:
-                        tools_found['Vite'] += 3
-                except json.JSONDecodeError:
-                    pass
-            
-            # Check for requirements.txt or pyproject.toml for Python frameworks
-            python_deps = next((content for content in contents if content.name in 
-                               ["requirements.txt", "pyproject.toml", "Pipfile"]), None)
-            if python_deps:
-                content = repo.get_contents(python_deps.path).decoded_content.decode('utf-8')
-                
-                if 'django' in content.lower():
-                    frameworks_found['Django'] += 5
-                if 'flask' in content.lower():
-                    frameworks_found['Flask'] += 5
-                if 'tensorflow' in content.lower() or 'tf' in content.lower():
-                    frameworks_found['TensorFlow'] += 5
-                if 'torch' in content.lower() or 'pytorch' in content.lower():
-                    frameworks_found['PyTorch'] += 5
-                if 'pytest' in content.lower():
-                    tools_found['Pytest'] += 3
-            
-            # Check for Docker
-            if any(docker_file in file_list for docker_file in ['dockerfile', 'docker-compose.yml', 'docker-compose.yaml']):
-                tools_found['Docker'] += 5
-            
-            # Check for CI/CD
-            if '.github' in [content.name for content in contents if content.type == "dir"]:
-                workflows_path = f"{repo.full_name}/contents/.github/workflows"
-                workflows_url = f"https://api.github.com/repos/{workflows_path}"
-                workflows_response = requests.get(workflows_url, headers=headers)
-                if workflows_response.status_code == 200:
-                    tools_found['GitHub Actions'] += 5
-                    tools_found['CI/CD'] += 3
-            
-            # Check for other tool config files
-            if any(tf_file.endswith('.tf') for tf_file in file_list):
-                tools_found['Terraform'] += 5
-            
-            if 'tsconfig.json' in file_list:
-                tools_found['TypeScript'] += 5
-            
-            # Check for Kubernetes
-            if any(k8s_file in file_list for k8s_file in ['k8s', 'kubernetes', 'helm', 'chart.yaml']):
-                tools_found['Kubernetes'] += 5
-                
-        except Exception as e:
-            print(f"Error analyzing repo {repo.name}: {e}")
+def repo_language_bytes(repo, session):
+    from github_api import api_url, get_json
+    # {language: bytes}; the primary-language vote is counted separately
+    return get_json(session, api_url(f"repos/{repo.full_name}/languages"))
+
+def analyze_repo_languages(repos, session):
+    # Skip forks to focus on original work. Breakdowns are cached per repo
+    # until it is pushed again
+    repos = list(repos.own())
+    analyze = state.snapshot.memoize('language-bytes', lambda repo: repo_language_bytes(repo, session), default=dict)
+    stats = LanguageStats()
+    for repo, breakdown in zip(repos, map_repos(analyze, repos)):
+        stats.add(breakdown, primary=repo.language, pushed_at=repo.pushed_at)
+    return stats
+
+# Framework and tool detection patterns, matched against every path in the
+# repo by kind: ".ext" extensions, "/name" at the root, "dir/sub" path
+# segments, "prefix_" file name starts, otherwise file or directory names
+# (see stack_detect.PathPatterns)
+framework_patterns = {
+    'React': ['.jsx', '.tsx'],
+    'Next.js': ['next.config', 'nextjs'],
+    'Vue.js': ['.vue', 'vue.config', 'vuejs'],
+    'Angular': ['angular.json', 'ngx'],
+    'Django': ['django', '/manage.py', '/wsgi.py', '/asgi.py'],
+    'Flask': ['flask', '/app.py', '/wsgi.py'],
+    'Express': ['express', '/app.js', '/server.js'],
+    'Spring Boot': ['spring-boot', 'application.properties'],
+    'Laravel': ['laravel', '/artisan'],
+    'Svelte': ['svelte.config', '.svelte'],
+    'Node.js': ['package.json'],
+    'TensorFlow': ['tensorflow'],
+    'PyTorch': ['torch', 'pytorch']
+}
+
+tool_patterns = {
+    'Docker': ['dockerfile', 'docker-compose'],
+    'Kubernetes': ['kubernetes', 'k8s', 'helm', 'chart.yaml', 'kustomization'],
+    'AWS': ['aws', 'cloudformation', 'serverless', 'samconfig'],
+    'GCP': ['gcp', 'app.yaml', 'cloudbuild'],
+    'Firebase': ['firebase', 'firestore.rules'],
+    'GitHub Actions': ['.github/workflows'],
+    'Jenkins': ['jenkinsfile'],
+    'Terraform': ['terraform', '.tf'],
+    'Jest': ['jest.config', '.test.js', '.test.ts'],
+    'Pytest': ['pytest', 'conftest', 'test_'],
+    'Webpack': ['webpack.config'],
+    'Vite': ['vite.config'],
+    'Nginx': ['nginx.conf', 'nginx'],
+    'GraphQL': ['.graphql', '.gql', 'apollo.config'],
+    'TypeScript': ['tsconfig', '.ts', '.tsx'],
+    'CI/CD': ['.github/workflows', '.gitlab-ci.yml', 'jenkins']
+}
+
+# Detect frameworks and tools from one recursive tree listing per repo
+def detect_frameworks_and_tools(repos, session):
+    from stack_detect import StackDetector
+    detector = StackDetector(session, framework_patterns, tool_patterns, manifests=state.manifest_cache)
+    analyze = state.snapshot.memoize('stack-paths', lambda repo: detector.detect(repo.full_name, repo.default_branch),
+                               decode=lambda value: (Counter(value[0]), Counter(value[1])),
+                               default=lambda: (Counter(), Counter()))
+    # Skip forks
+    results = map_repos(analyze, repos.own())
+    
+    frameworks_found = sum_counters(frameworks for frameworks, _ in results)
+    tools_found = sum_counters(tools for _, tools in results)
     
     return frameworks_found.most_common(5), tools_found.most_common(5)
 
 # Get data about languages, frameworks and tools
-languages = analyze_repo_languages(repo_list)
-top_languages = [lang[0] for lang in languages[:5]]
-data["LANGUAGES"] = ", ".join(top_languages)
+@sections.section("LANGUAGES", requires=("graphql_data", "session"), lazy=("repo_list",))
+def languages_section(graphql_data, session, repo_list):
+    if "LANGUAGES" in graphql_data:
+        return {"LANGUAGES": graphql_data["LANGUAGES"]}
+    languages = analyze_repo_languages(repo_list(), session)
+    return {"LANGUAGES": ", ".join(languages.ranking(5))}
+
+@sections.section("FRAMEWORKS", "TOOLS", requires=("repo_list", "session"))
+def stack_section(repo_list, session):
+    frameworks, tools = detect_frameworks_and_tools(repo_list, session)
+    return {
+        "FRAMEWORKS": ", ".join([framework[0] for framework in frameworks]),
+        "TOOLS": ", ".join([tool[0] for tool in tools]),
+    }
 
-frameworks, tools = detect_frameworks_and_tools(repo_list, github_token)
-data["FRAMEWORKS"] = ", ".join([framework[0] for framework in frameworks])
-data["TOOLS"] = ", ".join([tool[0] for tool in tools])
+# Technologies commonly associated with learning paths
+learning_areas = {
+    'DevOps': ['docker', 'kubernetes', 'jenkins', 'cicd', 'terraform', 'ansible'],
+    'Cloud Architecture': ['aws', 'gcp', 'azure', 'cloud', 'serverless', 'lambda'],
+    'System Design': ['architecture', 'system-design', 'distributed', 'scalable'],
+    'Microservices': ['microservice', 'service-mesh', 'api-gateway', 'grpc'],
+    'AI/ML': ['ai', 'ml', 'machine-learning', 'deep-learning', 'neural', 'tensorflow', 'pytorch'],
+    'Blockchain': ['blockchain', 'web3', 'ethereum', 'solidity', 'crypto'],
+    'Mobile Development': ['android', 'ios', 'flutter', 'react-native', 'mobile'],
+    'Game Development': ['game', 'unity', 'unreal', 'godot'],
+    'UI/UX Design': ['ui', 'ux', 'design', 'figma', 'sketch', 'adobe']
+}
+
+learning_matcher = KeywordMatcher(learning_areas)
+
+# Check a repo README for learning mentions
+def scan_repo_readme(repo, session):
+    from github_api import api_url, check_response
+
+    # /readme resolves whichever README file the repo has in one request
+    response = session.get(api_url(f"repos/{repo.full_name}/readme"))
+    if response.status_code == 404:
+        return Counter()
+
+    readme = check_response(response).json()
+    content = base64.b64decode(readme.get('content', '')).decode('utf-8', errors='replace')
+    return learning_matcher.score(content)
 
 # Determine what the user is currently learning
-def determine_learning_focus(repos, recent_projects):
-    # Technologies commonly associated with learning paths
-    learning_areas = {
-        'DevOps': ['docker', 'kubernetes', 'jenkins', 'cicd', 'terraform', 'ansible'],
-        'Cloud Architecture': ['aws', 'gcp', 'azure', 'cloud', 'serverless', 'lambda'],
-        'System Design': ['architecture', 'system-design', 'distributed', 'scalable'],
-        'Microservices': ['microservice', 'service-mesh', 'api-gateway', 'grpc'],
-        'AI/ML': ['ai', 'ml', 'machine-learning', 'deep-learning', 'neural', 'tensorflow', 'pytorch'],
-        'Blockchain': ['blockchain', 'web3', 'ethereum', 'solidity', 'crypto'],
-        'Mobile Development': ['android', 'ios', 'flutter', 'react-native', 'mobile'],
-        'Game Development': ['game', 'unity', 'unreal', 'godot'],
-        'UI/UX Design': ['ui', 'ux', 'design', 'figma', 'sketch', 'adobe']
-    }
-    
+def determine_learning_focus(repos, recent_projects, session):
+    from rate_limit import PRIORITY_LOW, section_priority
+
     # Check recent projects and READMEs for learning indicators
     learning_matches = Counter()
     
     # First check names of recent projects
     for project in recent_projects:
-        project_name_lower = project['name'].lower()
-        for area, keywords in learning_areas.items():
-            if any(keyword in project_name_lower for keyword in keywords):
-                learning_matches[area] += 3
-    
-    # Then check READMEs of repos for learning mentions
-    for repo in repos:
-        if repo.fork:
-            continue
-            
-        try:
-            readme = None
-            for readme_name in ['README.md', 'readme.md', 'Readme.md', 'README.txt']:
-                try:
-                    readme = repo.get_contents(readme_name)
-                    break
-                except:
-                    continue
-                    
-            if readme:
-                content = readme.decoded_content.decode('utf-8').lower()
-                
-                # Look for learning indicators
-                learning_indicators = ['learning', 'studying', 'experimenting with', 'exploring']
-                
-                for area, keywords in learning_areas.items():
-                    for keyword in keywords:
-                        if keyword in content:
-                            # Higher score if near learning indicators
-                            for indicator in learning_indicators:
-                                if indicator in content and abs(content.find(indicator) - content.find(keyword)) < 100:
-                                    learning_matches[area] += 2
-                            # Regular score for mention
-                            learning_matches[area] += 1
-                            
-        except Exception as e:
-            print(f"Error reading README for {repo.name}: {e}")
+        for area in learning_matcher.areas_in(project['name']):
+            learning_matches[area] += 3
+    
+    # Then check READMEs of repos for learning mentions. This is the lowest
+    # priority section: when the core budget runs low, only READMEs already
+    # in the snapshot are used
+    with section_priority(PRIORITY_LOW):
+        deferred = state.scheduler.should_defer()
+        if deferred:
+            print("Rate limit budget low, deferring README scans for changed repos")
+        analyze = state.snapshot.memoize('readme-focus', lambda repo: scan_repo_readme(repo, session),
+                                   decode=Counter, default=Counter, cached_only=deferred)
+        learning_matches.update(sum_counters(map_repos(analyze, repos.own())))
     
     # Check creation dates to prioritize newer interests
-    for repo in repos:
-        if repo.fork:
-            continue
-            
+    for repo in repos.own():
         # Give preference to repos created in the last 3 months
         if (datetime.datetime.now().replace(tzinfo=None) - 
             repo.created_at.replace(tzinfo=None)).days < 90:
             
-            repo_name_lower = repo.name.lower()
-            for area, keywords in learning_areas.items():
-                if any(keyword in repo_name_lower for keyword in keywords):
-                    learning_matches[area] += 2
+            for area in learning_matcher.areas_in(repo.name):
+                learning_matches[area] += 2
     
     # Return the top learning focus, or a reasonable default
     if learning_matches:
         return learning_matches.most_common(1)[0][0]
     return random.choice(list(learning_areas.keys()))
 
-data["CURRENT_LEARNING"] = determine_learning_focus(repo_list, recent_projects)
+# Lowest-priority section, so it gets a tighter budget than the default
+@sections.section("CURRENT_LEARNING", requires=("repo_list", "recent_projects", "session"), budget=120)
+def learning_section(repo_list, recent_projects, session):
+    return {"CURRENT_LEARNING": determine_learning_focus(repo_list, recent_projects, session)}
 
 # Developer quotes
 quotes = [
@@ -563,29 +529,181 @@ quotes = [
     "The only way to learn a new programming language is by writing programs in it.",
     "Testing leads to failure, and failure leads to understanding."
 ]
-data["RANDOM_QUOTE"] = random.choice(quotes)
+
+@sections.section("RANDOM_QUOTE")
+def quote_section():
+    return {"RANDOM_QUOTE": random.choice(quotes)}
 
 # Add a fun ASCII art
 def generate_ascii_art(username):
+    # The banner only depends on the name, so it is rendered once and cached
     try:
-        ascii_art = pyfiglet.figlet_format(username, font="slant")
-        return ascii_art
+        return state.figlets.render(username, "slant")
     except:
+        import cowsay
         return cowsay.get_output_string('cow', f"Hello, I'm {username}!")
 
-data["ASCII_ART"] = generate_ascii_art(github_username)
-
-# Read in the template README
-with open('README.md', 'r') as file:
-    readme = file.read()
+@sections.section("ASCII_ART", requires=("username",))
+def ascii_art_section(username):
+    return {"ASCII_ART": generate_ascii_art(username)}
 
-# Replace all placeholders
-for key, value in data.items():
-    placeholder = f"{{{{ {key} }}}}"
-    readme = readme.replace(placeholder, str(value))
-
-# Write the updated README
-with open('README.md', 'w') as file:
-    file.write(readme)
+def create_evaluation(username, metrics=None, organization=False):
+    """A fresh evaluation of the section registry for one profile"""
+    seeds = {
+        "username": username,
+        "token": github_token,
+    }
+    # The GraphQL stats query is for user(login:); orgs take the REST path
+    if organization:
+        seeds["graphql_data"] = {}
+    return Evaluation(sections, seeds=seeds, metrics=metrics, fallback=state.last_good.for_profile(username))
+
+def unavailable_keys(template, organization=False):
+    """Placeholders rendered as N/A without running their sections"""
+    if not organization:
+        return []
+    return [key for key in template.keys if sections.providers.get(key) in AUTHOR_SCOPED]
+
+def render(evaluation, template, output_path, unavailable=()):
+    # Only run the sections the template actually references, render in one
+    # pass and only touch the output if it changed. The deadline bounds the
+    # whole render; each section also gets its own budget
+    with deadline(RUN_DEADLINE_SECONDS):
+        data = evaluation.run([key for key in template.keys if key not in unavailable])
+    record_history(evaluation, data)
+    data.update({key: MISSING_VALUE for key in unavailable})
+    changed = write_if_changed(output_path, template.render(data))
+    if changed:
+        print(f"{output_path} updated successfully!")
+    else:
+        print(f"{output_path} already up to date")
+    return changed
+
+def record_history(evaluation, data):
+    # Stale fallback values and partial repo listings would skew the trends
+    stale_keys = {key for name in evaluation.stale for key in sections.nodes[name].provides}
+    repo_list = evaluation.values.get("repo_list")
+    state.history.record_run(
+        evaluation.values["username"],
+        {key: value for key, value in data.items() if key not in stale_keys},
+        repos=list(repo_list) if repo_list is not None and repo_list.complete else (),
+        repo_commits=evaluation.values.get("repo_commits"),
+    )
+
+def save_state():
+    # Persist the response cache, repo snapshot and other caches this run
+    # used for the next one
+    state.save()
+
+def check_fingerprint(username, template_path, output_path, metrics, clock_dependent=False):
+    """(fingerprint, unchanged) from a few conditional requests; (None, False) if it can't be computed"""
+    from preflight import compute_fingerprint
+    try:
+        with metrics.section("preflight"):
+            fingerprint = compute_fingerprint(state.session, username, template_path, clock_dependent)
+    except Exception as e:
+        print(f"Pre-flight check failed, rendering in full: {e}")
+        return None, False
+    return fingerprint, state.fingerprints.unchanged(username, output_path, fingerprint)
+
+def render_profile(username, template_path, output_path, force=False, organization=False):
+    """Render one profile README with the shared session, caches and snapshot
+
+    Returns (changed, skipped, metrics); skipped means the pre-flight
+    fingerprint matched the last complete render and nothing was run.
+    """
+    # Fresh metrics per profile; the session reports to whichever is current
+    metrics = Metrics()
+    state.set_metrics(metrics)
+
+    # Compile the template once
+    template = Template.from_file(template_path)
+
+    # Only worth it when the template needs API data at all. Computed even
+    # when forced, so the next run can skip again
+    fingerprint = None
+    unavailable = unavailable_keys(template, organization)
+    plan = sections.plan([key for key in template.keys if key not in unavailable], seeds=("username", "token"))
+    if "session" in plan:
+        clock_dependent = any(name in CLOCK_DEPENDENT for name in plan)
+        fingerprint, unchanged = check_fingerprint(username, template_path, output_path, metrics, clock_dependent)
+        if unchanged and not force:
+            print(f"{output_path}: inputs unchanged since the last run, skipping")
+            return False, True, metrics
+
+    evaluation = create_evaluation(username, metrics, organization)
+    changed = render(evaluation, template, output_path, unavailable)
+    # A render with stale fallbacks must not be skipped next time
+    if fingerprint is not None and not evaluation.stale:
+        state.fingerprints.record(username, output_path, fingerprint)
+    return changed, False, metrics
+
+def account_type(username):
+    from github_api import api_url, get_json
+    return get_json(state.session, api_url(f"users/{username}")).get('type', 'User')
+
+def load_profiles(path):
+    """Batch file: a JSON list of {"username", "template", "output"} entries
+
+    Returns (username, template, output, organization) tuples. An entry may
+    be an organization; its README gets the repo-scoped sections only.
+    """
+    with open(path, 'r') as file:
+        entries = json.load(file)
+    return [(entry['username'], entry.get('template', template_path), entry['output'],
+             account_type(entry['username']) == 'Organization') for entry in entries]
+
+def main():
+    parser = argparse.ArgumentParser(description="Render profile READMEs from GitHub data")
+    parser.add_argument('--batch', help="JSON file listing several profiles to render in one process")
+    parser.add_argument('--force', action='store_true', default=FORCE_REFRESH,
+                        help="Render even if the pre-flight fingerprint is unchanged")
+    args = parser.parse_args()
+
+    if args.batch:
+        profiles = load_profiles(args.batch)
+    else:
+        profiles = [(github_username, template_path, output_path, False)]
+
+    # Every profile shares the pool, response cache, rate-limit budget and
+    # repo snapshot
+    reports = {}
+    for username, profile_template, profile_output, organization in profiles:
+        changed, skipped, metrics = render_profile(username, profile_template, profile_output, force=args.force,
+                                                   organization=organization)
+        reports[username] = metrics.report(
+            username=username,
+            output=profile_output,
+            backend=stats_backend,
+            readme_changed=changed,
+            skipped=skipped,
+        )
+        print(metrics.summary_table())
+
+    save_state()
+
+    # Only report on what this run actually used
+    if state.used('http_cache'):
+        print(f"HTTP cache: {state.http_cache.hits} revalidated, {state.http_cache.misses} fetched")
+    if state.used('snapshot'):
+        print(f"Repo snapshot: {state.snapshot.reused} reused, {state.snapshot.analyzed} analyzed")
+    if state.used('manifest_cache'):
+        print(f"Manifests: {state.manifest_cache.hits} reused, {state.manifest_cache.fetched} fetched")
+    rate_limits = state.scheduler.summary() if state.used('scheduler') else {}
+    for resource, budget in rate_limits.items():
+        if budget['limit'] is not None:
+            print(f"Rate limit {resource}: {budget['remaining']}/{budget['limit']} remaining")
+
+    # Metrics file for tracking regressions across runs
+    snapshot = state.snapshot if state.used('snapshot') else None
+    shared = {
+        'snapshot': {'reused': snapshot.reused if snapshot else 0, 'analyzed': snapshot.analyzed if snapshot else 0},
+        'rate_limit_remaining': rate_limits,
+    }
+    if args.batch:
+        write_report(DEFAULT_METRICS_PATH, {'profiles': reports, **shared})
+    else:
+        write_report(DEFAULT_METRICS_PATH, {**reports[github_username], **shared})
 
-print("README.md updated successfully!")
+if __name__ == '__main__':
+    main()
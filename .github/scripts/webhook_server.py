@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Long-running webhook mode for the README generator
+Keeps one evaluated profile in memory, applies GitHub webhook deliveries
+(push, create, star, pull_request, issues) to just the fields they affect and
+re-renders after a quiet period, instead of rebuilding everything on a cron
+"""
+
+import os
+import hmac
+import json
+import time
+import hashlib
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import update_readme
+from metrics import Metrics
+from template import Template
+
+WEBHOOK_SECRET = os.environ.get("README_WEBHOOK_SECRET")
+# Bursts of deliveries (e.g. a push plus its create event) render once
+DEBOUNCE_SECONDS = float(os.environ.get("README_WEBHOOK_DEBOUNCE", "10"))
+# Re-render this often even without deliveries, so dates, account age and
+# the sliding activity windows move on
+REFRESH_SECONDS = float(os.environ.get("README_WEBHOOK_REFRESH_HOURS", "24")) * 3600
+
+
+def _bump(delta):
+    # Keeps the stored type: REST counts are strings, GraphQL ones ints. A
+    # fallback "N/A" raises ValueError, so the patch is skipped
+    return lambda old: type(old)(int(old) + delta)
+
+
+def _login(payload, *path):
+    value = payload
+    for key in path:
+        value = (value or {}).get(key)
+    return (value or '').lower()
+
+
+def on_push(service, payload):
+    # New commits: recent projects, activity and commit counts. The repo list
+    # is re-streamed through the HTTP cache and only the pushed repo, whose
+    # pushed_at changed, misses the snapshot
+    service.evaluation.invalidate(["events", "repo_list"])
+
+
+def on_create(service, payload):
+    # A new repository also changes the user's public_repos count
+    if payload.get('ref_type') == 'repository':
+        service.evaluation.invalidate(["events", "repo_list", "user"])
+    else:
+        service.evaluation.invalidate(["events"])
+
+
+def on_star(service, payload):
+    # Only stars on the user's own repos count towards STAR_COUNT
+    delta = {'created': 1, 'deleted': -1}.get(payload.get('action'), 0)
+    if delta and _login(payload, 'repository', 'owner', 'login') == service.username.lower():
+        service.evaluation.patch("STAR_COUNT", _bump(delta))
+
+
+def on_pull_request(service, payload):
+    if payload.get('action') == 'opened' and _login(payload, 'pull_request', 'user', 'login') == service.username.lower():
+        service.evaluation.patch("PR_COUNT", _bump(1))
+
+
+def on_issues(service, payload):
+    if payload.get('action') == 'opened' and _login(payload, 'issue', 'user', 'login') == service.username.lower():
+        service.evaluation.patch("ISSUE_COUNT", _bump(1))
+
+
+EVENT_HANDLERS = {
+    'push': on_push,
+    'create': on_create,
+    'star': on_star,
+    'pull_request': on_pull_request,
+    'issues': on_issues,
+}
+
+
+class Debouncer:
+    """Runs func once, delay seconds after the last trigger"""
+
+    def __init__(self, delay, func):
+        self.delay = delay
+        self.func = func
+        self.lock = threading.Lock()
+        self.timer = None
+
+    def trigger(self):
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+            self.timer = threading.Timer(self.delay, self.func)
+            self.timer.daemon = True
+            self.timer.start()
+
+
+class ReadmeService:
+    def __init__(self, username, template_path, output_path, debounce=DEBOUNCE_SECONDS):
+        self.username = username
+        self.template = Template.from_file(template_path)
+        self.output_path = output_path
+        self.evaluation = update_readme.create_evaluation(username)
+        # Held for a whole render, which can take minutes on a cold account
+        self.lock = threading.Lock()
+        # Deliveries only ever take this one, so they are acknowledged at once
+        # and applied at the start of the next render
+        self.queue_lock = threading.Lock()
+        self.queue = []
+        self.debouncer = Debouncer(debounce, self.render)
+
+    def _apply_queued(self):
+        with self.queue_lock:
+            deliveries, self.queue = self.queue, []
+        for handler, payload in deliveries:
+            # One bad delivery must not take the others (or the timer) down
+            try:
+                handler(self, payload)
+            except Exception as e:
+                print(f"Could not apply {handler.__name__} delivery: {e}")
+        return len(deliveries)
+
+    def render(self):
+        with self.lock:
+            applied = self._apply_queued()
+            metrics = Metrics()
+            update_readme.state.set_metrics(metrics)
+            self.evaluation.metrics = metrics
+            # Whatever moves with the clock, as for the pre-flight fingerprint
+            self.evaluation.invalidate(update_readme.CLOCK_DEPENDENT)
+
+            try:
+                changed = update_readme.render(self.evaluation, self.template, self.output_path)
+                update_readme.save_state()
+            except Exception as e:
+                print(f"Re-render failed, keeping the previous README: {e}")
+                return
+
+            totals = metrics.totals()
+            print(f"Rendered after {applied} event(s) in {totals.seconds:.2f}s "
+                  f"with {totals.requests} requests ({'changed' if changed else 'unchanged'})")
+
+    def handle(self, event, payload):
+        """Queue one delivery; returns False for events that don't affect the README"""
+        handler = EVENT_HANDLERS.get(event)
+        if handler is None:
+            return False
+        with self.queue_lock:
+            self.queue.append((handler, payload))
+        self.debouncer.trigger()
+        return True
+
+
+def verify_signature(secret, body, signature):
+    if not secret:
+        return True
+    expected = "sha256=" + hmac.new(secret.encode('utf-8'), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature or '')
+
+
+class WebhookHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status, message):
+        body = message.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/plain; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        if not verify_signature(WEBHOOK_SECRET, body, self.headers.get('X-Hub-Signature-256')):
+            return self._reply(401, "bad signature")
+
+        event = self.headers.get('X-GitHub-Event', '')
+        if event == 'ping':
+            return self._reply(200, "pong")
+        try:
+            payload = json.loads(body or b'{}')
+        except ValueError:
+            return self._reply(400, "invalid JSON")
+
+        if self.server.service.handle(event, payload):
+            return self._reply(202, "queued")
+        return self._reply(200, "ignored")
+
+
+def refresh_periodically(service, interval=REFRESH_SECONDS):
+    while True:
+        time.sleep(interval)
+        service.debouncer.trigger()
+
+
+def serve(service, host, port):
+    server = ThreadingHTTPServer((host, port), WebhookHandler)
+    server.daemon_threads = True
+    server.service = service
+    print(f"Listening for GitHub webhooks on http://{host}:{port}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Keep a profile README fresh from GitHub webhooks")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=int(os.environ.get("README_WEBHOOK_PORT", "8080")))
+    parser.add_argument('--username', default=update_readme.github_username)
+    parser.add_argument('--template', default=update_readme.template_path)
+    parser.add_argument('--output', default=update_readme.output_path)
+    args = parser.parse_args()
+
+    if not WEBHOOK_SECRET:
+        print("README_WEBHOOK_SECRET is not set, deliveries are not authenticated")
+
+    # One full render builds the in-memory model that deliveries then patch
+    service = ReadmeService(args.username, args.template, args.output)
+    service.render()
+    threading.Thread(target=refresh_periodically, args=(service,), daemon=True).start()
+    serve(service, args.host, args.port)
+
+
+if __name__ == '__main__':
+    main()